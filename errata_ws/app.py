@@ -1,14 +1,31 @@
 import os
+import signal
+import time
 
+import tornado.httpserver
+import tornado.ioloop
+import tornado.netutil
+import tornado.process
 import tornado.web
 
+from errata_ws import db
 from errata_ws import handlers
 from errata_ws import schemas
 from errata_ws.utils import config
+from errata_ws.utils import config_loader
+from errata_ws.utils import executors
+from errata_ws.utils import http
 from errata_ws.utils.logger import log_web as log
 
 
 
+# Seconds a worker waits for in-flight requests to complete upon shutdown.
+_SHUTDOWN_TIMEOUT_IN_SECONDS = 5
+
+# Seconds a process waits before listening again for cache invalidation notifications upon failure.
+_CACHE_LISTENER_RETRY_IN_SECONDS = 30
+
+
 def _get_path_to_front_end():
     """Return path to the front end javascript application.
 
@@ -43,6 +60,7 @@ def _get_app_endpoints():
         # ... search
         (r'/2/search/errata', handlers.search.SearchErrataRequestHandler),
         (r'/2/search/errata/setup', handlers.search.SearchErrataSetupRequestHandler),
+        (r'/2/search/errata/facet-counts', handlers.search.SearchErrataFacetCountsRequestHandler),
         (r'/2/search/errata/moderation', handlers.search.SearchErrataModerationRequestHandler),
 
         # ... PID
@@ -65,9 +83,11 @@ def _get_app_settings():
     }
 
 
-def _get_app():
+def _get_app(debug):
     """Returns application instance.
 
+    :param bool debug: Flag indicating whether to run in debug (autoreload) mode.
+
     """
     endpoints = _get_app_endpoints()
     log("Endpoint to handler mappings:")
@@ -77,26 +97,172 @@ def _get_app():
 
     schemas.init([i[0] for i in endpoints])
     return tornado.web.Application(endpoints,
-                                   debug=True,
+                                   debug=debug,
                                    **_get_app_settings())
 
 
-def run():
+def run(workers=None):
     """Runs web service.
 
+    :param int workers: Number of worker processes (0 = one per cpu), defaults to ws.conf workers.
+
+    """
+    if workers is None:
+        workers = config_loader.get_value('workers', 1)
+
+    if workers == 1:
+        _run_single()
+    else:
+        _run_multi(workers)
+
+
+def _run_single():
+    """Runs web service within a single process.
+
     """
     # Initialize application.
     log("Initializing")
-    app = _get_app()
+    app = _get_app(config.mode == 'dev')
 
     # Open port.
     app.listen(config.port)
     log("Running @ port {}".format(config.port))
 
+    # Invalidate cached aggregates upon modifications committed by other processes.
+    _listen_for_cache_invalidation()
+
     # Start processing requests.
     tornado.ioloop.IOLoop.instance().start()
 
 
+def _run_multi(workers):
+    """Runs web service within a set of pre-forked worker processes sharing the listening socket.
+
+    :param int workers: Number of worker processes (0 = one per cpu).
+
+    """
+    # Initialize application (debug mode is incompatible with forking).
+    log("Initializing")
+    app = _get_app(False)
+
+    # Open port.
+    sockets = tornado.netutil.bind_sockets(config.port)
+
+    # Fork workers - parent process supervises workers until they exit.
+    _set_parent_signal_handlers()
+    task_id = tornado.process.fork_processes(workers)
+
+    # Discard db engine state inherited from parent - engine is rebuilt lazily per worker.
+    db.session.dispose()
+
+    # Invalidate cached aggregates upon modifications committed by other processes.
+    _listen_for_cache_invalidation()
+
+    # Start processing requests.
+    server = tornado.httpserver.HTTPServer(app)
+    server.add_sockets(sockets)
+    _set_worker_signal_handlers(server)
+    log("Worker {} [pid={}] running @ port {}".format(task_id, os.getpid(), config.port))
+    tornado.ioloop.IOLoop.current().start()
+
+    # Release worker resources.
+    executors.shutdown()
+    db.session.dispose()
+    log("Worker {} [pid={}] stopped".format(task_id, os.getpid()))
+
+
+def _listen_for_cache_invalidation():
+    """Invalidates cached search aggregates & counts whenever a process commits modifications to cached entities.
+
+    Upon failure listening is retried, cached aggregates meanwhile expire as per their time to live.
+
+    """
+    ioloop = tornado.ioloop.IOLoop.current()
+
+    def _retry():
+        ioloop.call_later(_CACHE_LISTENER_RETRY_IN_SECONDS, _listen_for_cache_invalidation)
+
+    try:
+        with db.session.create():
+            listener = db.notifications.listen(db.notifications.CACHE_CHANNEL)
+    except Exception as err:
+        log("Cache invalidation notifications unavailable: {}".format(err))
+        _retry()
+        return
+
+    def _on_notify(fd, events):
+        try:
+            listener.poll()
+        except Exception as err:
+            log("Cache invalidation notifications interrupted: {}".format(err))
+            ioloop.remove_handler(fd)
+            try:
+                listener.close()
+            except Exception:
+                pass
+            db.cache.invalidate()
+            _retry()
+            return
+        if listener.notifies:
+            del listener.notifies[:]
+            db.cache.invalidate()
+
+    ioloop.add_handler(listener.fileno(), _on_notify, tornado.ioloop.IOLoop.READ)
+
+    # Notifications may have been missed whilst not listening.
+    db.cache.invalidate()
+
+
+def _set_parent_signal_handlers():
+    """Forwards termination signals received by parent process to worker processes.
+
+    """
+    def _on_signal(signum, frame):
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        os.killpg(os.getpgrp(), signal.SIGTERM)
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, _on_signal)
+
+
+def _set_worker_signal_handlers(server):
+    """Gracefully shuts down a worker process upon receipt of a termination signal.
+
+    :param tornado.httpserver.HTTPServer server: Worker's HTTP server.
+
+    """
+    ioloop = tornado.ioloop.IOLoop.current()
+
+    def _on_signal(signum, frame):
+        for i in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(i, signal.SIG_IGN)
+        ioloop.add_callback_from_signal(_shutdown, server)
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, _on_signal)
+
+
+def _shutdown(server):
+    """Stops accepting connections then stops IOLoop once in-flight requests complete.
+
+    :param tornado.httpserver.HTTPServer server: Worker's HTTP server.
+
+    """
+    log("Worker [pid={}] shutting down".format(os.getpid()))
+    server.stop()
+
+    ioloop = tornado.ioloop.IOLoop.current()
+    deadline = time.time() + _SHUTDOWN_TIMEOUT_IN_SECONDS
+
+    def _stop_when_idle():
+        if http.get_inflight_count() and time.time() < deadline:
+            ioloop.call_later(0.1, _stop_when_idle)
+        else:
+            ioloop.stop()
+
+    _stop_when_idle()
+
+
 def stop():
     """Stops web service.
 
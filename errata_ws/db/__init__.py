@@ -1,5 +1,7 @@
+from errata_ws.db import cache
 from errata_ws.db import dao
 from errata_ws.db import models
+from errata_ws.db import notifications
 from errata_ws.db import session
 from errata_ws.db import setup
 from errata_ws.db import utils
\ No newline at end of file
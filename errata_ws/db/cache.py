@@ -0,0 +1,131 @@
+import itertools
+
+from sqlalchemy import event
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from errata_ws.db.models import Issue
+from errata_ws.db.models import IssueFacet
+from errata_ws.db.models import IssueResource
+from errata_ws.db.models import PIDServiceTask
+from errata_ws.db.notifications import CACHE_CHANNEL
+from errata_ws.db.utils import get_count as get_count_from_db
+from errata_ws.utils import config_loader
+from errata_ws.utils import logger
+from errata_ws.utils.cache import Cache
+
+
+
+# Cache of search aggregates (facet counts) - per process, invalidated across processes via notifications (see app),
+# hence also bounded by a time to live should notifications be missed.
+_SEARCH = Cache(
+    config_loader.get_value('search_cache.ttl_in_seconds', 300),
+    config_loader.get_value('search_cache.max_size', 1024)
+    )
+
+# Cache of table row counts - short lived as tables are also written to by other processes.
+_COUNTS = Cache(config_loader.get_value('count_cache.ttl_in_seconds', 30), 64)
+
+# Entity types whose modification invalidates cached aggregates.
+_CACHED_TYPES = (Issue, IssueFacet, IssueResource, PIDServiceTask)
+
+# Session info key flagging that cached entities have been modified.
+_SESSION_INFO_KEY = 'errata_cache_modified'
+
+
+def get_search_aggregate(key, factory):
+    """Returns a cached search aggregate, computing it when absent.
+
+    :param tuple key: Aggregate cache key.
+    :param func factory: Function computing aggregate.
+
+    """
+    return _SEARCH.get_or_set(key, factory)
+
+
+def get_count(etype):
+    """Returns cached count of entity instances.
+
+    :param class etype: A supported entity type.
+
+    :returns: Entity collection count.
+    :rtype: int
+
+    """
+    return _COUNTS.get_or_set(etype.__name__, lambda: get_count_from_db(etype))
+
+
+def get_stats():
+    """Returns cache statistics.
+
+    :rtype: dict
+
+    """
+    return {
+        'counts': _COUNTS.get_stats(),
+        'search': _SEARCH.get_stats()
+    }
+
+
+def invalidate():
+    """Invalidates cached search aggregates & counts.
+
+    """
+    _SEARCH.invalidate()
+    _COUNTS.invalidate()
+    logger.log_db("search aggregate cache invalidated")
+
+
+@event.listens_for(Session, 'after_flush')
+def _on_after_flush(session, flush_context):
+    """Flags sessions that have modified cached entities.
+
+    """
+    if _is_modified(session):
+        session.info[_SESSION_INFO_KEY] = True
+
+
+@event.listens_for(Session, 'after_bulk_delete')
+def _on_after_bulk_delete(delete_context):
+    """Flags sessions that have bulk deleted cached entities.
+
+    """
+    delete_context.session.info[_SESSION_INFO_KEY] = True
+
+
+@event.listens_for(Session, 'before_commit')
+def _on_before_commit(session):
+    """Notifies modification of cached entities to other processes - delivered to listeners once the transaction commits.
+
+    """
+    if session.info.get(_SESSION_INFO_KEY) or _is_modified(session):
+        session.info[_SESSION_INFO_KEY] = True
+        session.execute(text('SELECT pg_notify(:channel, \'\')'), {'channel': CACHE_CHANNEL})
+
+
+@event.listens_for(Session, 'after_commit')
+def _on_after_commit(session):
+    """Invalidates cached aggregates once modifications to cached entities are committed.
+
+    """
+    if session.info.pop(_SESSION_INFO_KEY, False):
+        invalidate()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _on_after_rollback(session):
+    """Discards modification flag of rolled back sessions.
+
+    """
+    session.info.pop(_SESSION_INFO_KEY, None)
+
+
+def _is_modified(session):
+    """Returns flag indicating whether a session holds modifications to cached entities.
+
+    """
+    for instance in itertools.chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, _CACHED_TYPES):
+            return True
+
+    return False
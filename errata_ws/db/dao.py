@@ -1,4 +1,13 @@
+import collections
+import datetime as dt
+
+from sqlalchemy import and_
+from sqlalchemy import distinct
+from sqlalchemy import exists
+from sqlalchemy import func
 from sqlalchemy import or_
+from sqlalchemy import tuple_
+from sqlalchemy.orm import aliased
 
 from errata_ws.db.dao_validator import validate_delete_facets
 from errata_ws.db.dao_validator import validate_delete_resources
@@ -6,6 +15,7 @@ from errata_ws.db.dao_validator import validate_get_datasets
 from errata_ws.db.dao_validator import validate_get_issue
 from errata_ws.db.dao_validator import validate_get_issues
 from errata_ws.db.dao_validator import validate_get_resources
+from errata_ws.db.models import DatasetLineage
 from errata_ws.db.models import Issue
 from errata_ws.db.models import IssueFacet
 from errata_ws.db.models import IssueResource
@@ -54,6 +64,53 @@ def get_all_errata():
     return query(Issue).all()
 
 
+def get_errata_page(after_id=None, limit=None):
+    """Returns a page of errata ordered by primary key.
+
+    :param int after_id: Primary key after which page begins (keyset cursor).
+    :param int limit: Maximum number of errata to return.
+
+    :returns: List of errata.
+
+    """
+    qry = query(Issue)
+    if after_id is not None:
+        qry = qry.filter(Issue.id > after_id)
+    qry = qry.order_by(Issue.id.asc())
+    if limit is not None:
+        qry = qry.limit(limit)
+
+    return qry.all()
+
+
+def get_errata_batches(after_id=None, limit=None, batch_size=500):
+    """Yields batches of errata ordered by primary key using a server side cursor.
+
+    :param int after_id: Primary key after which iteration begins (keyset cursor).
+    :param int limit: Maximum number of errata to yield.
+    :param int batch_size: Number of errata per batch.
+
+    :returns: Generator of errata lists.
+
+    """
+    qry = query(Issue)
+    if after_id is not None:
+        qry = qry.filter(Issue.id > after_id)
+    qry = qry.order_by(Issue.id.asc())
+    if limit is not None:
+        qry = qry.limit(limit)
+    qry = qry.execution_options(stream_results=True).yield_per(batch_size)
+
+    batch = []
+    for issue in qry:
+        batch.append(issue)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 @validate(validate_get_datasets)
 def get_datasets(issue_uid):
     """Returns set of issue datasets.
@@ -88,6 +145,20 @@ def get_issue(uid):
     return qry.first()
 
 
+def exists_title(title):
+    """Returns flag indicating whether an issue with the passed title exists in db.
+
+    :param str title: Issue title.
+
+    :rtype: bool
+
+    """
+    qry = raw_query(Issue.id)
+    qry = qry.filter(Issue.title == title)
+
+    return raw_query(qry.exists()).scalar()
+
+
 def get_titles():
     """Returns list of all issue titles in db
 
@@ -99,6 +170,115 @@ def get_titles():
     return [x[0] for x in qry.all()]
 
 
+def get_dataset_errata(dataset_ids):
+    """Returns map of dataset identifiers to uids of issues with which they are associated.
+
+    :param list dataset_ids: Dataset identifiers (as stored, i.e. drs#version or drs.vNNNN).
+
+    :returns: Dataset identifier to issue uids map (datasets without issues are omitted).
+    :rtype: dict
+
+    """
+    if not dataset_ids:
+        return {}
+
+    qry = raw_query(IssueResource.resource_location, IssueResource.issue_uid)
+    qry = qry.filter(IssueResource.resource_type == ISSUE_RESOURCE_DATASET)
+    qry = qry.filter(IssueResource.resource_location.in_(dataset_ids))
+
+    result = {}
+    for location, issue_uid in qry.all():
+        result.setdefault(location, set()).add(issue_uid)
+
+    return result
+
+
+def delete_lineage(drs_id):
+    """Deletes version lineages containing a dataset.
+
+    :param str drs_id: Dataset identifier (without version).
+
+    """
+    sub_qry = raw_query(DatasetLineage.lineage_key)
+    sub_qry = sub_qry.filter(DatasetLineage.drs_id == drs_id)
+
+    qry = query(DatasetLineage)
+    qry = qry.filter(DatasetLineage.lineage_key.in_(sub_qry.subquery()))
+    qry.delete(synchronize_session=False)
+
+
+def delete_lineage_by_handles(handles):
+    """Deletes version lineages containing any of a set of dataset handles.
+
+    :param list handles: Dataset handles.
+
+    """
+    sub_qry = raw_query(DatasetLineage.lineage_key)
+    sub_qry = sub_qry.filter(DatasetLineage.handle.in_(handles))
+
+    qry = query(DatasetLineage)
+    qry = qry.filter(DatasetLineage.lineage_key.in_(sub_qry.subquery()))
+    qry.delete(synchronize_session=False)
+
+
+def get_lineage(handle):
+    """Returns version lineage of a dataset.
+
+    :param str handle: Dataset handle.
+
+    :returns: Lineage versions ordered from first to latest (empty if unknown).
+    :rtype: list
+
+    """
+    sub_qry = raw_query(DatasetLineage.lineage_key)
+    sub_qry = sub_qry.filter(DatasetLineage.handle == handle)
+
+    qry = query(DatasetLineage)
+    qry = qry.filter(DatasetLineage.lineage_key.in_(sub_qry.subquery()))
+    qry = qry.order_by(DatasetLineage.ordinal.asc())
+
+    return qry.all()
+
+
+def has_unsettled_pid_tasks(dataset_ids, synced_after):
+    """Returns flag indicating whether errata of any of a set of datasets may not yet be reflected by their handles,
+    i.e. they have pid service tasks either pending or synced after a point in time.
+
+    :param list dataset_ids: Dataset identifiers (drs#version or drs.vversion).
+    :param datetime synced_after: Sync threshold.
+
+    :rtype: bool
+
+    """
+    qry = raw_query(PIDServiceTask.id)
+    qry = qry.filter(PIDServiceTask.dataset_id.in_(dataset_ids))
+    qry = qry.filter(or_(PIDServiceTask.status == PID_TASK_STATE_QUEUED,
+                         PIDServiceTask.status == PID_TASK_STATE_ERROR,
+                         PIDServiceTask.synced > synced_after))
+
+    return qry.first() is not None
+
+
+def get_stale_lineage_keys(refreshed_before, limit=None):
+    """Returns keys of version lineages last refreshed before a point in time.
+
+    :param datetime refreshed_before: Refresh threshold.
+    :param int limit: Maximum number of keys to return.
+
+    :returns: Lineage keys ordered from least recently refreshed.
+    :rtype: list
+
+    """
+    qry = raw_query(DatasetLineage.lineage_key)
+    qry = qry.group_by(DatasetLineage.lineage_key)
+    qry = qry.having(func.min(DatasetLineage.refreshed) < refreshed_before)
+    qry = qry.order_by(func.min(DatasetLineage.refreshed).asc())
+    if limit is not None:
+        qry = qry.limit(limit)
+
+    return [i[0] for i in qry.all()]
+
+
 def get_descriptions():
     """Returns list of all issue descriptions in db
 
@@ -131,20 +311,61 @@ def get_issues(criteria, exclude_in_moderation=True):
         Issue.moderation_status
         )
 
+    qry = _filter_issues(qry, criteria, exclude_in_moderation)
+
+    return qry.all()
+
+
+def _filter_issues(qry, criteria, exclude_in_moderation):
+    """Restricts an issue query to issues matching a set of search criteria.
+
+    :param qry: Query over issue columns.
+    :param list criteria: Set of facet-type:facet-value criteria.
+    :param bool exclude_in_moderation: Flag indicating whether issues in moderation are excluded.
+
+    """
     if exclude_in_moderation is True:
-        print(777)
         qry = qry.filter(Issue.moderation_status.notin_([
             constants.ISSUE_MODERATION_IN_REVIEW,
             constants.ISSUE_MODERATION_REJECTED
             ]))
 
-    for item in criteria:
-        sub_qry = query(IssueFacet.issue_uid)
-        sub_qry = sub_qry.filter(IssueFacet.facet_type == ':'.join(item.split(':')[0:3]))
-        sub_qry = text_filter(sub_qry, IssueFacet.facet_value, item.split(':')[-1])
+    # Issues must match every criterion, i.e. number of distinct matching facets == number of criteria.
+    criteria = set([(':'.join(i.split(':')[0:3]).upper(), unicode(i.split(':')[-1]).strip().upper())
+                    for i in criteria])
+    if criteria:
+        facet_type = func.upper(IssueFacet.facet_type)
+        facet_value = func.upper(IssueFacet.facet_value)
+        sub_qry = raw_query(IssueFacet.issue_uid)
+        sub_qry = sub_qry.filter(or_(*[and_(facet_type == t, facet_value == v) for t, v in criteria]))
+        sub_qry = sub_qry.group_by(IssueFacet.issue_uid)
+        sub_qry = sub_qry.having(func.count(distinct(tuple_(facet_type, facet_value))) == len(criteria))
         qry = qry.filter(Issue.uid.in_(sub_qry))
-    
-    return qry.all()
+
+    return qry
+
+
+def get_facet_counts(criteria, exclude_in_moderation=True):
+    """Returns number of issues carrying each facet value, restricted to issues matching a set of criteria.
+
+    :param list criteria: Set of facet-type:facet-value criteria.
+    :param bool exclude_in_moderation: Flag indicating whether issues in moderation are excluded.
+
+    :returns: Sorted list of (facet, issue count) tuples.
+    :rtype: list
+
+    """
+    issue_uids = _filter_issues(raw_query(Issue.uid), criteria, exclude_in_moderation)
+
+    qry = raw_query(
+        IssueFacet.facet_type,
+        IssueFacet.facet_value,
+        func.count(IssueFacet.issue_uid)
+        )
+    qry = qry.filter(IssueFacet.issue_uid.in_(issue_uids))
+    qry = qry.group_by(IssueFacet.facet_type, IssueFacet.facet_value)
+
+    return sorted([(u'{}:{}'.format(i[0], i[1]), i[2]) for i in qry.all()])
 
 
 def get_facets(issue_uid=None):
@@ -163,14 +384,34 @@ def get_facets(issue_uid=None):
     return qry.all()
 
 
+def get_facets_by_issues(issue_uids):
+    """Returns collection of facets associated with a set of issues.
+
+    :param list issue_uids: Unique issue identifiers.
+
+    :returns: Set of facets from database.
+    :rtype: list
+
+    """
+    if not issue_uids:
+        return []
+
+    qry = query(IssueFacet)
+    qry = qry.filter(IssueFacet.issue_uid.in_(issue_uids))
+
+    return qry.all()
+
+
 def get_pid_tasks(criteria=None):
-    """Returns pid service tasks awaiting processing.
+    """Returns pid service tasks awaiting processing, i.e. queued or due for retry.
 
     """
     qry = query(PIDServiceTask)
     if criteria is None:
         qry = qry.filter(or_(PIDServiceTask.status == PID_TASK_STATE_QUEUED,
                              PIDServiceTask.status == PID_TASK_STATE_ERROR))
+        qry = qry.filter(or_(PIDServiceTask.next_attempt == None,
+                             PIDServiceTask.next_attempt <= dt.datetime.utcnow()))
     else:
         for field, value in criteria:
             if field == 'project':
@@ -182,6 +423,140 @@ def get_pid_tasks(criteria=None):
     return qry.all()
 
 
+def claim_pid_tasks(owner, lease_timeout, after_id, limit):
+    """Claims a batch of pid service tasks awaiting processing by leasing them to a worker.
+
+    Only tasks due for processing are claimed. Tasks locked by concurrent claims or leased to other
+    workers are skipped, expired leases are reclaimed. A task is only claimed together with every
+    earlier pending task of its (dataset, issue) pair, so that a pair's tasks are always processed
+    in order, e.g. a delete is never dispatched whilst an earlier insert awaits retry.
+    Tasks blocked by an earlier task awaiting retry or leased are excluded before the batch is limited,
+    tasks blocked by an earlier task locked by a concurrent claim are scanned but left unclaimed.
+    Leases take effect once the session is committed.
+
+    :param str owner: Lease owner, i.e. worker identifier.
+    :param int lease_timeout: Lease duration in seconds.
+    :param int after_id: Identifier of last task scanned by previous batch (0 = first batch).
+    :param int limit: Maximum number of tasks to scan.
+
+    :returns: Claimed tasks ordered by identifier, identifier of last task scanned (None if none).
+    :rtype: tuple
+
+    """
+    now = dt.datetime.utcnow()
+
+    earlier = aliased(PIDServiceTask)
+    blocked = exists().where(and_(
+        earlier.dataset_id == PIDServiceTask.dataset_id,
+        earlier.issue_uid == PIDServiceTask.issue_uid,
+        earlier.id < PIDServiceTask.id,
+        or_(earlier.status == PID_TASK_STATE_QUEUED,
+            earlier.status == PID_TASK_STATE_ERROR),
+        or_(earlier.next_attempt > now,
+            earlier.lease_expires >= now)
+        ))
+
+    qry = query(PIDServiceTask)
+    qry = qry.filter(or_(PIDServiceTask.status == PID_TASK_STATE_QUEUED,
+                         PIDServiceTask.status == PID_TASK_STATE_ERROR))
+    qry = qry.filter(or_(PIDServiceTask.next_attempt == None,
+                         PIDServiceTask.next_attempt <= now))
+    qry = qry.filter(or_(PIDServiceTask.lease_expires == None,
+                         PIDServiceTask.lease_expires < now))
+    qry = qry.filter(~blocked)
+    qry = qry.filter(PIDServiceTask.id > after_id)
+    qry = qry.order_by(PIDServiceTask.id.asc())
+    qry = qry.limit(limit)
+    qry = qry.with_for_update(skip_locked=True, of=PIDServiceTask)
+
+    tasks = qry.all()
+    last_id = tasks[-1].id if tasks else None
+    claimed = set([i.id for i in tasks])
+    chains = get_pending_pid_task_ids([(i.dataset_id, i.issue_uid) for i in tasks])
+    tasks = [i for i in tasks
+             if claimed.issuperset([j for j in chains[(i.dataset_id, i.issue_uid)] if j < i.id])]
+    for task in tasks:
+        task.lease_owner = owner
+        task.lease_expires = now + dt.timedelta(seconds=lease_timeout)
+
+    return tasks, last_id
+
+
+def get_pending_pid_task_ids(pairs):
+    """Returns identifiers of pending (queued or failed) pid service tasks, whether due or not.
+
+    :param list pairs: (dataset identifier, issue uid) pairs.
+
+    :returns: Task identifiers in order keyed by (dataset identifier, issue uid).
+    :rtype: dict
+
+    """
+    result = collections.defaultdict(list)
+    if not pairs:
+        return result
+
+    qry = raw_query(PIDServiceTask.dataset_id, PIDServiceTask.issue_uid, PIDServiceTask.id)
+    qry = qry.filter(or_(PIDServiceTask.status == PID_TASK_STATE_QUEUED,
+                         PIDServiceTask.status == PID_TASK_STATE_ERROR))
+    qry = qry.filter(tuple_(PIDServiceTask.dataset_id, PIDServiceTask.issue_uid).in_(set(pairs)))
+    qry = qry.order_by(PIDServiceTask.id.asc())
+    for dataset_id, issue_uid, task_id in qry.all():
+        result[(dataset_id, issue_uid)].append(task_id)
+
+    return result
+
+
+def get_dead_pid_task_pairs(pairs):
+    """Returns (dataset, issue) pairs with dead-lettered pid service tasks.
+
+    :param list pairs: (dataset identifier, issue uid) pairs.
+
+    :returns: (dataset identifier, issue uid) pairs.
+    :rtype: set
+
+    """
+    if not pairs:
+        return set()
+
+    qry = raw_query(PIDServiceTask.dataset_id, PIDServiceTask.issue_uid)
+    qry = qry.filter(PIDServiceTask.status == PID_TASK_STATE_DEAD)
+    qry = qry.filter(tuple_(PIDServiceTask.dataset_id, PIDServiceTask.issue_uid).in_(set(pairs)))
+
+    return set([tuple(i) for i in qry.distinct().all()])
+
+
+def get_leased_pid_tasks(owner):
+    """Returns pid service tasks currently leased to a worker.
+
+    :param str owner: Lease owner, i.e. worker identifier.
+
+    :returns: Leased tasks ordered by identifier.
+    :rtype: list
+
+    """
+    qry = query(PIDServiceTask)
+    qry = qry.filter(PIDServiceTask.lease_owner == owner)
+    qry = qry.filter(PIDServiceTask.lease_expires > dt.datetime.utcnow())
+    qry = qry.order_by(PIDServiceTask.id.asc())
+
+    return qry.all()
+
+
+def get_next_pid_task_attempt():
+    """Returns earliest scheduled retry of pid service tasks awaiting processing.
+
+    :returns: Earliest future retry time or None if no retry is scheduled.
+    :rtype: datetime.datetime
+
+    """
+    qry = raw_query(func.min(PIDServiceTask.next_attempt))
+    qry = qry.filter(or_(PIDServiceTask.status == PID_TASK_STATE_QUEUED,
+                         PIDServiceTask.status == PID_TASK_STATE_ERROR))
+    qry = qry.filter(PIDServiceTask.next_attempt > dt.datetime.utcnow())
+
+    return qry.scalar()
+
+
 def get_project_facets():
     """Returns collection of facets.
 
@@ -213,3 +588,21 @@ def get_resources(issue_uid=None):
         qry = text_filter(qry, IssueResource.issue_uid, issue_uid)
 
     return qry.all()
+
+
+def get_resources_by_issues(issue_uids):
+    """Returns collection of resources associated with a set of issues.
+
+    :param list issue_uids: Unique issue identifiers.
+
+    :returns: Related resource collection.
+    :rtype: list
+
+    """
+    if not issue_uids:
+        return []
+
+    qry = query(IssueResource)
+    qry = qry.filter(IssueResource.issue_uid.in_(issue_uids))
+
+    return qry.all()
@@ -64,6 +64,7 @@ _ISSUE_RESOURCE_ENUM = Enum(
 # PID task states.
 _PID_TASK_STATE_ENUM = Enum(
     PID_TASK_STATE_COMPLETE,
+    PID_TASK_STATE_DEAD,
     PID_TASK_STATE_ERROR,
     PID_TASK_STATE_QUEUED,
     schema=_SCHEMA,
@@ -94,7 +95,7 @@ class Issue(Entity):
     project = Column(Unicode(63), nullable=False)
     institute = Column(Unicode(63), nullable=False)
     uid = Column(Unicode(63), nullable=False, unique=True, default=uuid.uuid4())
-    title = Column(Unicode(255), nullable=False)
+    title = Column(Unicode(255), nullable=False, index=True)
     description = Column(Text, nullable=False)
     severity = Column(_ISSUE_SEVERITY_ENUM, nullable=False)
     status = Column(_ISSUE_STATUS_ENUM, nullable=False)
@@ -144,6 +145,31 @@ class Issue(Entity):
 Index('idx_issue_description', func.lower(Issue.description))
 
 
+def issues_to_dicts(issues, resources, facets):
+    """Encodes a collection of issues as simple dictionaries.
+
+    Resources & facets are grouped by issue in a single pass so that cost is
+    linear in the number of issues, resources & facets.
+
+    :param list issues: Collection of issues.
+    :param list resources: Collection of issue resources.
+    :param list facets: Collection of issue facets.
+
+    :returns: Encoded issues.
+    :rtype: list
+
+    """
+    resources_by_issue = collections.defaultdict(list)
+    for resource in resources:
+        resources_by_issue[resource.issue_uid].append(resource)
+
+    facets_by_issue = collections.defaultdict(list)
+    for facet in facets:
+        facets_by_issue[facet.issue_uid].append(facet)
+
+    return [i.to_dict(resources_by_issue.get(i.uid, []), facets_by_issue.get(i.uid, [])) for i in issues]
+
+
 class IssueFacet(Entity):
     """Associates an issue with a searchable facet such as severity.
 
@@ -170,6 +196,10 @@ class IssueFacet(Entity):
             self.issue_uid, self.facet_type, self.facet_value)
 
 
+# Set case insensitive facet search index.
+Index('idx_issue_facet_type_value', func.upper(IssueFacet.facet_type), func.upper(IssueFacet.facet_value))
+
+
 class IssueResource(Entity):
     """Associates an issue with a resource such as a dataset id.
 
@@ -184,7 +214,7 @@ class IssueResource(Entity):
     # Column definitions.
     issue_uid = Column(Unicode(63), ForeignKey('{}.tbl_issue.uid'.format(_SCHEMA)), nullable=False)
     resource_type = Column(_ISSUE_RESOURCE_ENUM, nullable=False)
-    resource_location = Column(Unicode(1023), nullable=False)
+    resource_location = Column(Unicode(1023), nullable=False, index=True)
 
 
     def __repr__(self):
@@ -195,6 +225,34 @@ class IssueResource(Entity):
             self.issue_uid, self.resource_type, self.resource_location)
 
 
+class DatasetLineage(Entity):
+    """A dataset version within a version lineage (REPLACES / REPLACED_BY chain) recorded by handle service.
+
+    """
+    # SQLAlchemy directives.
+    __tablename__ = 'tbl_dataset_lineage'
+    __table_args__ = (
+        {'schema': _SCHEMA}
+    )
+
+    # Column definitions.
+    lineage_key = Column(Unicode(255), nullable=False, index=True)
+    handle = Column(Unicode(255), nullable=False, unique=True)
+    drs_id = Column(Unicode(1023), nullable=False, index=True)
+    version = Column(Unicode(63), nullable=False)
+    ordinal = Column(Integer, nullable=False)
+    errata_ids = Column(Text)
+    refreshed = Column(DateTime, nullable=False, default=dt.datetime.utcnow)
+
+
+    def __repr__(self):
+        """Instance representation.
+
+        """
+        return "<DatasetLineage(handle={}, drs_id={}, version={})>".format(
+            self.handle, self.drs_id, self.version)
+
+
 class PIDServiceTask(Entity):
     """Tasks to be dispatched to PID handler service.
 
@@ -209,10 +267,14 @@ class PIDServiceTask(Entity):
     action = Column(_PID_ACTION_ENUM, nullable=False)
     status = Column(_PID_TASK_STATE_ENUM, nullable=False, default=PID_TASK_STATE_QUEUED)
     issue_uid = Column(Unicode(63), ForeignKey('{}.tbl_issue.uid'.format(_SCHEMA)), nullable=False)
-    dataset_id = Column(Unicode(1023), nullable=False)
+    dataset_id = Column(Unicode(1023), nullable=False, index=True)
     error = Column(Unicode(1023))
     try_count = Column(Integer, default=0)
     timestamp = Column(DateTime, nullable=False, default=dt.datetime.utcnow)
+    next_attempt = Column(DateTime, index=True)
+    synced = Column(DateTime)
+    lease_owner = Column(Unicode(255))
+    lease_expires = Column(DateTime, index=True)
 
 
     def __repr__(self):
@@ -0,0 +1,95 @@
+import select
+
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import event
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from errata_ws.db import session as db_session
+from errata_ws.db.models import PIDServiceTask
+from errata_ws.utils import logger
+
+
+
+# Channel upon which commits of modifications to cached entities are notified.
+CACHE_CHANNEL = 'errata_cache'
+
+# Channel upon which insertion of pid service tasks is notified.
+PID_TASK_CHANNEL = 'errata_pid_task'
+
+# Session info key flagging that pid service tasks have been inserted.
+_SESSION_INFO_KEY = 'errata_pid_task_inserted'
+
+
+def listen(channel=PID_TASK_CHANNEL):
+    """Returns a dedicated db connection listening upon a notification channel.
+
+    The connection is detached from the engine's pool, hence the engine must already be instantiated.
+
+    :param str channel: Notification channel.
+
+    :returns: A psycopg2 connection.
+
+    """
+    connection = db_session.sa_engine.raw_connection()
+    connection.detach()
+    connection = connection.connection
+    connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+    connection.cursor().execute('LISTEN {}'.format(channel))
+    logger.log_db("listening upon channel: {}".format(channel))
+
+    return connection
+
+
+def wait(connection, timeout):
+    """Waits for notifications upon a listening connection.
+
+    :param connection: A psycopg2 connection returned by listen.
+    :param float timeout: Maximum time to wait in seconds.
+
+    :returns: Number of notifications received (0 if timed out).
+    :rtype: int
+
+    """
+    if select.select([connection], [], [], timeout) == ([], [], []):
+        return 0
+
+    connection.poll()
+    count = len(connection.notifies)
+    del connection.notifies[:]
+
+    return count
+
+
+@event.listens_for(Session, 'after_flush')
+def _on_after_flush(session, flush_context):
+    """Flags sessions that have inserted pid service tasks.
+
+    """
+    if [i for i in session.new if isinstance(i, PIDServiceTask)]:
+        session.info[_SESSION_INFO_KEY] = True
+
+
+@event.listens_for(Session, 'before_commit')
+def _on_before_commit(session):
+    """Notifies insertion of pid service tasks - delivered to listeners once the transaction commits.
+
+    """
+    if session.info.get(_SESSION_INFO_KEY) or [i for i in session.new if isinstance(i, PIDServiceTask)]:
+        session.execute(text('SELECT pg_notify(:channel, \'\')'), {'channel': PID_TASK_CHANNEL})
+
+
+@event.listens_for(Session, 'after_commit')
+def _on_after_commit(session):
+    """Discards insertion flag of committed sessions.
+
+    """
+    session.info.pop(_SESSION_INFO_KEY, None)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _on_after_rollback(session):
+    """Discards insertion flag of rolled back sessions.
+
+    """
+    session.info.pop(_SESSION_INFO_KEY, None)
@@ -1,11 +1,19 @@
 import contextlib
+import itertools
 import logging
 import os
+import threading
+import time
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.orm import scoped_session
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from errata_ws.utils import config
+from errata_ws.utils import config_loader
 from errata_ws.utils import logger
 
 
@@ -16,8 +24,31 @@ sa_engine = None
 # DB connection string used to create SQLAlchemy engine.
 _sa_connection = None
 
-# SQLAlchemy session.
-_sa_session = None
+# SQLAlchemy session factory bound to engine.
+_sa_session_factory = None
+
+# Registry of SQLAlchemy sessions keyed by db session scope.
+_sa_sessions = scoped_session(lambda: _sa_session_factory(), scopefunc=lambda: _get_scope())
+
+# Thread local stack of active db session scopes.
+_scopes = threading.local()
+
+# Generator of db session scope identifiers.
+_scope_ids = itertools.count(1)
+
+# Lock guarding engine instantiation.
+_sa_engine_lock = threading.Lock()
+
+# Engine connection pool checkout statistics.
+_pool_stats = {
+    'checkouts': 0,
+    'timeouts': 0,
+    'wait_max': 0.0,
+    'wait_total': 0.0
+}
+
+# Lock guarding pool statistics.
+_pool_stats_lock = threading.Lock()
 
 
 # Set of SQLAlchemy loggers.
@@ -40,17 +71,91 @@ def init_logging():
 init_logging()
 
 
+class _InstrumentedQueuePool(QueuePool):
+    """Connection pool that records checkout wait statistics.
+
+    """
+    def _do_get(self):
+        """Checks out a connection from the pool.
+
+        """
+        started = time.time()
+        try:
+            connection = super(_InstrumentedQueuePool, self)._do_get()
+        except TimeoutError:
+            _on_pool_checkout(time.time() - started, True)
+            raise
+        else:
+            _on_pool_checkout(time.time() - started)
+
+        return connection
+
+
+def _on_pool_checkout(wait, timed_out=False):
+    """Updates pool statistics following a connection checkout.
+
+    """
+    with _pool_stats_lock:
+        _pool_stats['checkouts'] += 1
+        _pool_stats['timeouts'] += 1 if timed_out else 0
+        _pool_stats['wait_max'] = max(_pool_stats['wait_max'], wait)
+        _pool_stats['wait_total'] += wait
+
+
+def get_pool_stats():
+    """Returns engine connection pool statistics for current process.
+
+    :returns: Pool statistics or None if engine has not been instantiated.
+    :rtype: dict
+
+    """
+    if sa_engine is None or not isinstance(sa_engine.pool, QueuePool):
+        return None
+
+    with _pool_stats_lock:
+        stats = dict(_pool_stats)
+    stats['wait_avg'] = stats['wait_total'] / stats['checkouts'] if stats['checkouts'] else 0.0
+    stats['pid'] = os.getpid()
+    stats['size'] = sa_engine.pool.size()
+    stats['checked_in'] = sa_engine.pool.checkedin()
+    stats['checked_out'] = sa_engine.pool.checkedout()
+    stats['overflow'] = sa_engine.pool.overflow()
+
+    return stats
+
+
+def _create_engine(connection):
+    """Instantiates a pooled SQLAlchemy engine configured from ws.conf.
+
+    :param str connection: A db connection string.
+
+    """
+    return create_engine(
+        connection,
+        echo=False,
+        poolclass=_InstrumentedQueuePool,
+        pool_size=config_loader.get_value('db_pool.size', 5),
+        max_overflow=config_loader.get_value('db_pool.max_overflow', 10),
+        pool_timeout=config_loader.get_value('db_pool.timeout_in_seconds', 30),
+        pool_recycle=config_loader.get_value('db_pool.recycle_in_seconds', 3600),
+        pool_pre_ping=config_loader.get_value('db_pool.pre_ping', True)
+        )
+
+
 @contextlib.contextmanager
 def create(connection=None, commitable=False):
     """Starts & manages a db session.
 
+    Sessions are scoped to the calling thread's innermost create block, so
+    concurrent requests (and nested blocks) never share a session.
+
     :param connection: DB connection information.
     :type connection: str | sqlalchemy.Engine
     :param bool commitable: Flag indicating whether to auto-commit.
 
     """
     _start(connection)
-    logger.log_db("db connection [{}] opened".format(id(_sa_session)))
+    logger.log_db("db connection [{}] opened".format(id(_get_session())))
 
     try:
         yield
@@ -62,7 +167,7 @@ def create(connection=None, commitable=False):
     else:
         if commitable:
             commit()
-        logger.log_db("db connection [{}] closed".format(id(_sa_session)))
+        logger.log_db("db connection [{}] closed".format(id(_get_session())))
     finally:
         _end()
 
@@ -74,51 +179,122 @@ def _start(connection=None):
     :type connection: str | sqlalchemy.Engine
 
     """
-    global sa_engine
-    global _sa_session
-    global _sa_connection
-
     # Set default connection.
     if connection is None:
         connection = config.db
         if os.getenv("ERRATA_DB_PWD"):
             connection = connection.replace("ENV_ERRATA_DB_PWD", os.getenv("ERRATA_DB_PWD"))
 
-    # Set engine.
+    # Set engine (once per process per connection).
     if _sa_connection != connection:
+        _set_engine(connection)
+
+    # Open a new scope & bind a session to it.
+    _push_scope()
+    _sa_sessions()
+
+
+def _set_engine(connection):
+    """Sets engine & session factory.
+
+    :param connection: Either a db connection string or a SQLAlchemy db engine.
+    :type connection: str | sqlalchemy.Engine
+
+    """
+    global sa_engine
+    global _sa_session_factory
+    global _sa_connection
+
+    with _sa_engine_lock:
+        if _sa_connection == connection:
+            return
+        if isinstance(connection, Engine):
+            engine = connection
+        else:
+            engine = _create_engine(connection)
+        _sa_session_factory = sessionmaker(bind=engine)
+        sa_engine = engine
         _sa_connection = connection
-        sa_engine = create_engine(connection, echo=False)
         logger.log_db("db engine instantiated: {}".format(id(sa_engine)))
 
-    # Set session.
-    _sa_session = sessionmaker(bind=sa_engine)()
+
+def dispose():
+    """Disposes of engine & session factory, e.g. within a freshly forked worker process.
+
+    """
+    global sa_engine
+    global _sa_session_factory
+    global _sa_connection
+
+    with _sa_engine_lock:
+        if sa_engine is not None:
+            sa_engine.dispose()
+            logger.log_db("db engine disposed: {}".format(id(sa_engine)))
+        sa_engine = None
+        _sa_session_factory = None
+        _sa_connection = None
 
 
 def _end():
     """Ends a session.
 
     """
-    global _sa_session
+    if _get_scope() is not None:
+        _sa_sessions.remove()
+        _pop_scope()
+
+
+def _get_scope():
+    """Returns identifier of current thread's innermost db session scope.
+
+    """
+    try:
+        return _scopes.stack[-1]
+    except (AttributeError, IndexError):
+        return None
 
-    if _sa_session is not None:
-        _sa_session.close()
-        _sa_session = None
+
+def _push_scope():
+    """Opens a db session scope upon current thread.
+
+    """
+    try:
+        _scopes.stack.append(next(_scope_ids))
+    except AttributeError:
+        _scopes.stack = [next(_scope_ids)]
+
+
+def _pop_scope():
+    """Closes current thread's innermost db session scope.
+
+    """
+    _scopes.stack.pop()
+
+
+def _get_session():
+    """Returns session bound to current scope (None if outside of a session context).
+
+    """
+    if _get_scope() is not None:
+        return _sa_sessions()
 
 
 def commit():
     """Commits a session.
 
     """
-    if _sa_session is not None:
-        _sa_session.commit()
+    session = _get_session()
+    if session is not None:
+        session.commit()
 
 
 def rollback():
     """Rolls back a session.
 
     """
-    if _sa_session is not None:
-        _sa_session.rollback()
+    session = _get_session()
+    if session is not None:
+        session.rollback()
 
 
 def insert(instance, auto_commit=True):
@@ -128,8 +304,9 @@ def insert(instance, auto_commit=True):
     :param bool auto_commit: Flag indicating whether a commit is to be issued.
 
     """
-    if instance is not None and _sa_session is not None:
-        _sa_session.add(instance)
+    session = _get_session()
+    if instance is not None and session is not None:
+        session.add(instance)
         if auto_commit:
             commit()
 
@@ -156,8 +333,9 @@ def delete(instance, auto_commit=True):
     :type auto_commit: bool
 
     """
-    if instance is not None and _sa_session is not None:
-        _sa_session.delete(instance)
+    session = _get_session()
+    if instance is not None and session is not None:
+        session.delete(instance)
         if auto_commit:
             commit()
 
@@ -169,7 +347,7 @@ def update(instance, auto_commit=True):
     :param bool auto_commit: Flag indicating whether a commit is to be issued.
 
     """
-    if instance is not None and _sa_session is not None:
+    if instance is not None and _get_session() is not None:
         if auto_commit:
             commit()
 
@@ -180,12 +358,13 @@ def query(*etypes):
     """Begins a query operation against a session.
 
     """
-    if len(etypes) == 0 or _sa_session is None:
+    session = _get_session()
+    if len(etypes) == 0 or session is None:
         return None
 
     q = None
     for etype in etypes:
-        q = _sa_session.query(etype) if q is None else q.join(etype)
+        q = session.query(etype) if q is None else q.join(etype)
     return q
 
 
@@ -195,4 +374,4 @@ def raw_query(*args):
     Avoids having to expose directly the underlying SQLAlchemy session.
 
     """
-    return _sa_session.query(*args)
+    return _get_session().query(*args)
@@ -9,6 +9,15 @@ from errata_ws.db.utils import METADATA
 # Set of db schemas.
 _SCHEMAS = {'errata'}
 
+# Set of upgrades applied to tables created by earlier releases (executed outside of a transaction).
+_UPGRADES = [
+    'ALTER TYPE errata."PIDTaskStateEnum" ADD VALUE IF NOT EXISTS \'dead\'',
+    'ALTER TABLE errata.tbl_pid_service_task ADD COLUMN IF NOT EXISTS next_attempt TIMESTAMP WITHOUT TIME ZONE',
+    'ALTER TABLE errata.tbl_pid_service_task ADD COLUMN IF NOT EXISTS synced TIMESTAMP WITHOUT TIME ZONE',
+    'ALTER TABLE errata.tbl_pid_service_task ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(255)',
+    'ALTER TABLE errata.tbl_pid_service_task ADD COLUMN IF NOT EXISTS lease_expires TIMESTAMP WITHOUT TIME ZONE'
+]
+
 
 def execute():
     """Sets up a database.
@@ -24,3 +33,15 @@ def execute():
 
     # Initialize tables.
     METADATA.create_all(db_session.sa_engine)
+
+    # Upgrade tables.
+    for ddl in _UPGRADES:
+        db_session.sa_engine.execution_options(isolation_level='AUTOCOMMIT').execute(ddl)
+
+    # Initialize indexes declared after tables were created.
+    for table in METADATA.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(db_session.sa_engine)
+            except:
+                pass
@@ -0,0 +1,152 @@
+import json
+import threading
+
+from errata_ws.utils import config_loader
+from errata_ws.utils import logger
+from errata_ws.utils.cache import Cache
+
+
+
+# Handle record time to live in seconds.
+_TTL = config_loader.get_value('pid.handle_cache.ttl_in_seconds', 600)
+
+# Process local cache of handle records keyed by handle string.
+_LOCAL = Cache(_TTL, config_loader.get_value('pid.handle_cache.max_size', 10000))
+
+# Shared backend type: memory (process local only) | redis (shared across processes).
+_BACKEND = config_loader.get_value('pid.handle_cache.backend', 'memory')
+
+# Shared backend key prefix.
+_SHARED_KEY_PREFIX = 'errata:handle:'
+
+# Shared backend client (instantiated on demand).
+_shared = None
+
+# Shared backend statistics.
+_shared_stats = {
+    'hits': 0,
+    'misses': 0,
+    'errors': 0
+}
+
+# Lock guarding shared backend client instantiation & statistics.
+_lock = threading.Lock()
+
+
+def get(handle_string):
+    """Returns a cached handle record.
+
+    :param str handle_string: Handle identifier.
+
+    :returns: Handle record or None if not cached.
+    :rtype: dict
+
+    """
+    record = _LOCAL.get(handle_string)
+    if record is None and _get_shared() is not None:
+        record = _get_from_shared(handle_string)
+        if record is not None:
+            _LOCAL.set(handle_string, record)
+
+    return record
+
+
+def put(handle_string, record):
+    """Caches a handle record.
+
+    :param str handle_string: Handle identifier.
+    :param dict record: Handle record.
+
+    """
+    _LOCAL.set(handle_string, record)
+    if _get_shared() is not None:
+        _set_in_shared(handle_string, record)
+
+
+def get_stats():
+    """Returns handle record cache statistics.
+
+    :rtype: dict
+
+    """
+    stats = _LOCAL.get_stats()
+    stats['backend'] = _BACKEND
+    if _BACKEND != 'memory':
+        with _lock:
+            stats['shared'] = dict(_shared_stats)
+
+    return stats
+
+
+def invalidate(handle_string=None):
+    """Removes either a single record or all records from process local cache.
+
+    :param str handle_string: Handle identifier (if None all records are removed).
+
+    """
+    _LOCAL.invalidate(handle_string)
+
+
+def _get_shared():
+    """Returns shared backend client (None if backend is process local or unavailable).
+
+    """
+    global _shared
+    global _BACKEND
+
+    if _BACKEND != 'redis':
+        return None
+
+    with _lock:
+        if _shared is None:
+            try:
+                import redis
+            except ImportError:
+                logger.log_pid_warning('Handle cache: redis package not installed, falling back to memory backend')
+                _BACKEND = 'memory'
+                return None
+            _shared = redis.StrictRedis.from_url(
+                config_loader.get_value('pid.handle_cache.redis_url', 'redis://localhost:6379/0'),
+                socket_timeout=1
+                )
+
+    return _shared
+
+
+def _get_from_shared(handle_string):
+    """Returns a handle record from shared backend.
+
+    """
+    try:
+        encoded = _shared.get(_SHARED_KEY_PREFIX + handle_string)
+    except Exception as err:
+        _on_shared(errors=1)
+        logger.log_pid_error('Handle cache: shared backend read failed: {}'.format(err))
+        return None
+
+    if encoded is None:
+        _on_shared(misses=1)
+        return None
+
+    _on_shared(hits=1)
+    return json.loads(encoded)
+
+
+def _set_in_shared(handle_string, record):
+    """Writes a handle record to shared backend.
+
+    """
+    try:
+        _shared.setex(_SHARED_KEY_PREFIX + handle_string, _TTL, json.dumps(record))
+    except Exception as err:
+        _on_shared(errors=1)
+        logger.log_pid_error('Handle cache: shared backend write failed: {}'.format(err))
+
+
+def _on_shared(**deltas):
+    """Updates shared backend statistics.
+
+    """
+    with _lock:
+        for key, delta in deltas.items():
+            _shared_stats[key] += delta
@@ -0,0 +1,108 @@
+import json
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from errata_ws.utils import config_loader
+from errata_ws.utils import logger
+
+
+
+# Handle server REST API base url.
+_HANDLE_SERVER_URL = config_loader.get_value('pid.handle_server_url', 'https://hdl.handle.net')
+
+# Handle server request timeout in seconds.
+_TIMEOUT = config_loader.get_value('pid.handle_server_timeout_in_seconds', 30)
+
+# Maximum number of keep-alive connections held open to handle server.
+_MAX_CONNECTIONS = config_loader.get_value('thread_pools.handle', 16)
+
+# Handle server response code: handle not found.
+_RESPONSE_CODE_NOT_FOUND = 100
+
+# Shared client (instantiated on demand).
+_client = None
+
+# Lock guarding client instantiation.
+_lock = threading.Lock()
+
+
+class HandleClient(object):
+    """Read only handle server REST API client reusing keep-alive connections.
+
+    Exposes the subset of the b2handle EUDATHandleClient interface used by the errata service.
+
+    """
+    def __init__(self, server_url=_HANDLE_SERVER_URL, timeout=_TIMEOUT, max_connections=_MAX_CONNECTIONS):
+        """Instance constructor.
+
+        :param str server_url: Handle server base url.
+        :param int timeout: Request timeout in seconds.
+        :param int max_connections: Maximum number of keep-alive connections.
+
+        """
+        self.server_url = server_url.rstrip('/')
+        self.timeout = timeout
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+
+    def retrieve_handle_record(self, handle):
+        """Returns a handle record as a dictionary of utf8 encoded type/value pairs.
+
+        Where a type appears several times only the first value is returned.
+
+        :param str handle: Handle string, e.g. 21.14100/aae01ba2-8436-378d-84ed-5a06b9fbee46.
+
+        :returns: Handle record or None if handle does not exist.
+        :rtype: dict
+
+        """
+        response = self._session.get(
+            '{}/api/handles/{}'.format(self.server_url, handle),
+            timeout=self.timeout
+            )
+        if response.status_code == requests.codes.NOT_FOUND:
+            return None
+        response.raise_for_status()
+
+        content = response.json()
+        if content.get('responseCode') == _RESPONSE_CODE_NOT_FOUND:
+            return None
+
+        record = {}
+        for entry in content.get('values', []):
+            key = entry['type'].encode('utf8')
+            if key not in record:
+                record[key] = _encode_value(entry['data']['value'])
+
+        return record
+
+
+def get_client():
+    """Returns shared handle server client.
+
+    :rtype: HandleClient
+
+    """
+    global _client
+
+    with _lock:
+        if _client is None:
+            _client = HandleClient()
+            logger.log_pid('Handle client instantiated: {}'.format(_client.server_url))
+
+        return _client
+
+
+def _encode_value(value):
+    """Encodes a handle record value as a utf8 string.
+
+    """
+    if isinstance(value, basestring):
+        return unicode(value).encode('utf8')
+
+    return json.dumps(value)
@@ -1,6 +1,7 @@
 from errata_ws.handle_service.constants import *
 from errata_ws.handle_service.exceptions import *
 from errata_ws.handle_service.utils import get_handle_by_handle_string, make_handle_from_drsid_and_versionnumber
+from errata_ws.handle_service.utils import get_handles_by_handle_strings
 from errata_ws.utils import logger
 
 
@@ -28,6 +29,8 @@ class DatasetRecord(Record):
         self.successor = None
         self.predecessor = None
         self.children = None
+        self.children_by_filename = None
+        self.children_by_checksum = None
         self.is_first = False
         self.is_latest = False
         self.url = handle[URL]
@@ -52,33 +55,39 @@ class DatasetRecord(Record):
         """
         This function checks whether the handle record of the previous and next dataset exists in loop or not.
         If it exists we recycle the data rather than querying the handle service.
-        If not it's inevitable to get it from the HS.
+        If not it's inevitable to get it from the HS (successor & predecessor are then fetched concurrently).
         :param handle:
         :param handle_client_instance:
-        :param kwargs:
+        :param kwargs: successor | predecessor records from previous loop, lineage map of prefetched handles.
         """
+        # Fetch successor & predecessor handles not recycled from previous loop nor prefetched.
+        handle_keys = {'successor': SUCCESSOR, 'predecessor': PREDECESSOR}
+        handle_strings = {d: handle[k].replace(HDL_PREFIX, '') for d, k in handle_keys.items()
+                          if d not in kwargs and k in handle}
+        lineage = dict(kwargs.get('lineage', {}))
+        to_fetch = [i for i in handle_strings.values() if i not in lineage]
+        if to_fetch:
+            logger.log('Retrieving {} handle(s) for dataset record...'.format(len(to_fetch)))
+            lineage.update(zip(to_fetch, get_handles_by_handle_strings(to_fetch, handle_client_instance, True)))
+
         for direction in ['successor', 'predecessor']:
             if direction not in kwargs:
-                try:
-                    logger.log('Retrieving {} for dataset record...'.format(direction))
-                    try:
-                        if direction == 'successor':
-                            self.successor = get_handle_by_handle_string(handle[SUCCESSOR].replace(HDL_PREFIX, ''),
-                                                                         handle_client_instance)
-                            self.is_latest = False
-                            self.lineage[1] = True
-                        else:
-                            self.predecessor = get_handle_by_handle_string(handle[PREDECESSOR].replace(HDL_PREFIX, ''),
-                                                                           handle_client_instance)
-                            self.lineage[0] = True
-                    except HandleNotFoundError:
+                if direction in handle_strings:
+                    related = lineage[handle_strings[direction]]
+                    if related is None:
                         logger.log_warning('{} handle was not found in handle server.'.format(direction))
-                    logger.log('{} successfully retrieved.'.format(direction))
-                except KeyError:
-                    if direction == 'successor':
-                        self.is_latest = True
+                    elif direction == 'successor':
+                        self.successor = related
+                        self.is_latest = False
+                        self.lineage[1] = True
                     else:
-                        self.is_first = True
+                        self.predecessor = related
+                        self.lineage[0] = True
+                    logger.log('{} successfully retrieved.'.format(direction))
+                elif direction == 'successor':
+                    self.is_latest = True
+                else:
+                    self.is_first = True
             else:
                 logger.log('Retrieving {} from previous loop.'.format(direction.upper()))
                 if direction == 'successor':
@@ -100,10 +109,21 @@ class DatasetRecord(Record):
         """
         list_of_children = []
         if CHILDREN in self.handle.keys():
-            for child in map(lambda x: x.replace(HDL_PREFIX, ''), self.handle[CHILDREN].split(';')):
-                child_handle = get_handle_by_handle_string(child, handle_client_instance)
-                list_of_children.append(child_handle)
-        self.children = list_of_children
+            children = map(lambda x: x.replace(HDL_PREFIX, ''), self.handle[CHILDREN].split(';'))
+            list_of_children = get_handles_by_handle_strings(children, handle_client_instance)
+        self.set_children(list_of_children)
+
+    def set_children(self, children):
+        """Sets children together with filename & checksum lookup maps (first position of each key).
+        :param children: list of child handle registers contained in dataset
+
+        """
+        self.children = children
+        self.children_by_filename = {}
+        self.children_by_checksum = {}
+        for i, child in enumerate(children):
+            self.children_by_filename.setdefault(child.get(FILE_NAME), i)
+            self.children_by_checksum.setdefault(child.get(CHECKSUM), i)
 
 
 class FileRecord(Record):
@@ -134,10 +154,16 @@ class FileRecord(Record):
         :returns: parent handle
 
         """
+        # Fetch parents then their (not already fetched) successors & predecessors, each as one concurrent batch.
+        handles = get_handles_by_handle_strings(self.parents, handle_client_instance)
+        lineage = dict(zip(self.parents, handles))
+        related = [i[k].replace(HDL_PREFIX, '') for i in handles for k in (SUCCESSOR, PREDECESSOR) if k in i]
+        related = sorted(set(related).difference(lineage))
+        lineage.update(zip(related, get_handles_by_handle_strings(related, handle_client_instance, True)))
+
         parents = []
-        for parent in self.parents:
-            parents.append(DatasetRecord(get_handle_by_handle_string(parent, handle_client_instance),
-                                         handle_client_instance))
+        for handle in handles:
+            parents.append(DatasetRecord(handle, handle_client_instance, lineage=lineage))
         for i, parent in enumerate(parents):
             if parent.successor in parents and parent.successor.index() != i+1:
                 var = parents[i+1]
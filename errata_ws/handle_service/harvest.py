@@ -1,26 +1,30 @@
 from time import time
 
-from b2handle.handleclient import EUDATHandleClient
-
+from errata_ws.handle_service import lineage
+from errata_ws.handle_service.client import get_client
 from errata_ws.handle_service.crawler import crawler
-from errata_ws.handle_service.constants import ERRATA_IDS, DRS, VERSION
+from errata_ws.handle_service.constants import ERRATA_IDS, DRS, VERSION, DATASET
+from errata_ws.handle_service.utils import get_aggregation_level
 from errata_ws.handle_service.utils import get_handle_by_handle_string
 from errata_ws.utils import logger
 
 
 def harvest_errata_information(input_handle_string):
     """Given a handle, this will harvest all the errata data related to that handle as well as the previous versions.
+    Dataset level lineages are answered from db when recorded, otherwise crawled & recorded.
 
     :param input_handle_string: Handle identifier
     :return: errata information, dset/file_id
     """
     tick = time()
-    logger.log_pid("--CREATING HANDLE CLIENT--")
-    handle_client = EUDATHandleClient.instantiate_for_read_access()
-    logger.log_pid("--HANDLE CLIENT CREATED--")
+    handle_client = get_client()
     logger.log_pid("----------------------------------BEGIN ISSUE TRACKING----------------------------------")
-    handle = get_handle_by_handle_string(input_handle_string, handle_client)
-    list_of_uids, incomplete_search = crawler(handle, handle_client)
+    list_of_uids, incomplete_search = lineage.get_errata_information(input_handle_string, handle_client), 0
+    if list_of_uids is None:
+        handle = get_handle_by_handle_string(input_handle_string, handle_client)
+        list_of_uids, incomplete_search = crawler(handle, handle_client)
+        if get_aggregation_level(handle) == DATASET and not incomplete_search:
+            lineage.save(list_of_uids)
     logger.log_pid("ELAPSED TIME TILL COMPLETION : " + str(time()-tick) + " SECONDS")
     logger.log_pid("-----------------------------------END ISSUE TRACKING-----------------------------------")
     logger.log_pid("LIST OF UIDS GENERATED IS...")
@@ -35,9 +39,7 @@ def harvest_simple_errata(input_handle_string):
     :return: errata_id list, empty if no errata is found.
     """
     output = []
-    logger.log_pid("--CREATING HANDLE CLIENT--")
-    handle_client = EUDATHandleClient.instantiate_for_read_access()
-    logger.log_pid("--SUCCESSFULLY CREATED CLIENT--")
+    handle_client = get_client()
     logger.log_pid("--RETRIEVING HANDLE FROM PID SERVER--")
     handle = get_handle_by_handle_string(input_handle_string, handle_client)
     if handle is not None:
@@ -0,0 +1,145 @@
+import datetime as dt
+
+from errata_ws import db
+from errata_ws.handle_service.constants import *
+from errata_ws.handle_service.crawler import crawler
+from errata_ws.handle_service.exceptions import HandleNotFoundError
+from errata_ws.handle_service.utils import get_handle_by_handle_string
+from errata_ws.utils import config_loader
+from errata_ws.utils import logger
+
+
+
+# Age in seconds after which a recorded lineage is no longer trusted.
+MAX_AGE = config_loader.get_value('pid.lineage.max_age_in_seconds', 86400)
+
+# Age in seconds after which the background refresher re-crawls a recorded lineage.
+REFRESH_AGE = config_loader.get_value('pid.lineage.refresh_age_in_seconds', 43200)
+
+# Time in seconds after a pid task is synced during which handles of its dataset may still
+# carry previous errata (handle server applies updates asynchronously, handle records are cached).
+SETTLE_TIME = config_loader.get_value('pid.lineage.settle_time_in_seconds', 900)
+
+
+def get_errata_information(handle_string, handle_client_instance):
+    """Returns errata information of a dataset version lineage recorded in db.
+
+    Only the newest version is revalidated against handle service: if it has been
+    replaced since the lineage was recorded, the lineage is considered unknown.
+    Lineages whose errata may be changing (see is_settled) are not served.
+
+    :param handle_string: Dataset handle identifier
+    :param handle_client_instance: handle client instance
+    :returns: dictionary {dataset_handle: [errata_ids, dset_id, dset_version, order, 0, 0, 0]} formatted as per crawler,
+              None if lineage is unknown, expired or outgrown.
+    :rtype: dict
+    """
+    try:
+        with db.session.create(commitable=True):
+            versions = db.dao.get_lineage(handle_string)
+            if not versions:
+                return None
+            if min([i.refreshed for i in versions]) < dt.datetime.utcnow() - dt.timedelta(seconds=MAX_AGE):
+                logger.log_pid('Recorded lineage of {} has expired.'.format(handle_string))
+                return None
+            if not is_settled([(i.drs_id, i.version) for i in versions]):
+                logger.log_pid('Recorded lineage of {} has errata awaiting sync.'.format(handle_string))
+                return None
+
+            # Revalidate newest version.
+            latest = versions[-1]
+            try:
+                handle = get_handle_by_handle_string(latest.handle, handle_client_instance, use_cache=False)
+            except HandleNotFoundError:
+                return None
+            if SUCCESSOR in handle:
+                logger.log_pid('Recorded lineage of {} has a new version.'.format(handle_string))
+                return None
+            latest.errata_ids = handle.get(ERRATA_IDS)
+
+            ordinal = [i.ordinal for i in versions if i.handle == handle_string][0]
+            return {i.handle: [i.errata_ids, i.drs_id, i.version, i.ordinal - ordinal, 0, 0, 0] for i in versions}
+
+    except Exception as err:
+        logger.log_pid_error('Recorded lineage lookup failed: {}'.format(err))
+        return None
+
+
+def save(output):
+    """Records a dataset level crawler output as a version lineage.
+
+    :param dict output: Crawler output {dataset_handle: [errata_ids, dset_id, dset_version, order, ...]}.
+
+    """
+    versions = sorted(output.items(), key=lambda i: i[1][3])
+    try:
+        with db.session.create(commitable=True):
+            db.dao.delete_lineage_by_handles([i[0] for i in versions])
+            if not is_settled([(i[1][1], i[1][2]) for i in versions]):
+                logger.log_pid('Lineage not recorded as it has errata awaiting sync.')
+                return
+            for ordinal, (handle_string, (errata_ids, drs_id, version)) in \
+                enumerate([(i[0], i[1][0:3]) for i in versions]):
+                instance = db.models.DatasetLineage()
+                instance.lineage_key = versions[0][0]
+                instance.handle = handle_string
+                instance.drs_id = drs_id
+                instance.version = version
+                instance.ordinal = ordinal
+                instance.errata_ids = errata_ids
+                db.session.insert(instance, False)
+
+    except Exception as err:
+        logger.log_pid_warning('Lineage could not be recorded: {}'.format(err))
+
+
+def is_settled(versions):
+    """Returns flag indicating whether handles of a set of dataset versions reflect their errata,
+    i.e. none has pid service tasks awaiting sync or synced within SETTLE_TIME.
+
+    Must be called within a db session.
+
+    :param list versions: (drs identifier, version) pairs.
+
+    :rtype: bool
+
+    """
+    dataset_ids = []
+    for drs_id, version in versions:
+        dataset_ids += [u'{}#{}'.format(drs_id, version), u'{}.v{}'.format(drs_id, version)]
+
+    return not db.dao.has_unsettled_pid_tasks(
+        dataset_ids, dt.datetime.utcnow() - dt.timedelta(seconds=SETTLE_TIME))
+
+
+def refresh(handle_client_instance, limit=None):
+    """Re-crawls recorded lineages that are due to be refreshed.
+
+    :param handle_client_instance: handle client instance
+    :param int limit: Maximum number of lineages to refresh.
+
+    :returns: Number of lineages refreshed.
+    :rtype: int
+
+    """
+    with db.session.create():
+        lineage_keys = db.dao.get_stale_lineage_keys(
+            dt.datetime.utcnow() - dt.timedelta(seconds=REFRESH_AGE), limit)
+
+    for lineage_key in lineage_keys:
+        with db.session.create():
+            versions = db.dao.get_lineage(lineage_key)
+        if not versions:
+            continue
+        latest = versions[-1].handle
+        try:
+            output, incomplete_search = crawler(get_handle_by_handle_string(latest, handle_client_instance),
+                                                handle_client_instance)
+        except Exception as err:
+            logger.log_pid_warning('Lineage {} could not be refreshed: {}'.format(lineage_key, err))
+            with db.session.create(commitable=True):
+                db.dao.delete_lineage_by_handles([lineage_key])
+        else:
+            save(output)
+
+    return len(lineage_keys)
@@ -6,10 +6,13 @@ from requests.packages.urllib3.exceptions import InsecurePlatformWarning
 from requests.packages.urllib3.exceptions import SNIMissingWarning
 
 from errata_ws.handle_service.constants import *
+from errata_ws.handle_service import cache
 from errata_ws.handle_service import constants
 from errata_ws.handle_service import exceptions
 from errata_ws.utils import logger
 from errata_ws.utils import config
+from errata_ws.utils import config_loader
+from errata_ws.utils import executors
 
 
 # Disable requests warnings.
@@ -17,26 +20,58 @@ requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 requests.packages.urllib3.disable_warnings(InsecurePlatformWarning)
 requests.packages.urllib3.disable_warnings(SNIMissingWarning)
 
+# Maximum number of concurrent handle server requests issued on behalf of a single resolution.
+_MAX_CONCURRENT_FETCHES = config_loader.get_value('pid.handle_fetch_concurrency', 8)
 
-def get_handle_by_handle_string(handle_string, handle_client_instance):
+
+def get_handle_by_handle_string(handle_string, handle_client_instance, use_cache=True):
     """Using the EUDATHandle service, this function reads the required handle using the handle_string.
+    Records are served from the handle record cache when possible.
 
     :param handle_string: String
     :param handle_client_instance: EUDATClient instance
+    :param use_cache: Flag indicating whether a cached record may be served (fetched records are always cached).
 
     :returns: json formatted handle
     :rtype: str
 
     """
+    handle_record = cache.get(handle_string) if use_cache else None
+    if handle_record is not None:
+        return handle_record
+
     logger.log('GETTING HANDLE FROM HANDLE SERVER WITH KEY... ' + handle_string)
     encoded_dict = handle_client_instance.retrieve_handle_record(handle_string)
     if encoded_dict is not None:
         handle_record = {k.decode('utf8'): v.decode('utf8') for k, v in encoded_dict.items()}
+        cache.put(handle_string, handle_record)
         return handle_record
     else:
         raise exceptions.HandleNotFoundError
 
 
+def get_handles_by_handle_strings(handle_strings, handle_client_instance, ignore_missing=False):
+    """Reads a set of handles concurrently using the handle_strings.
+
+    :param list handle_strings: Collection of handle strings.
+    :param handle_client_instance: EUDATClient instance
+    :param bool ignore_missing: Flag indicating whether unknown handles map to None rather than raising.
+
+    :returns: json formatted handles in handle string order
+    :rtype: list
+
+    """
+    def _get_handle(handle_string):
+        try:
+            return get_handle_by_handle_string(handle_string, handle_client_instance)
+        except exceptions.HandleNotFoundError:
+            if ignore_missing:
+                return None
+            raise
+
+    return executors.map_bounded(_get_handle, handle_strings, executors.POOL_HANDLE, _MAX_CONCURRENT_FETCHES)
+
+
 def has_successor_and_predecessors(handle):
     """Inspects handle for successors and predecessors.
 
@@ -138,16 +173,17 @@ def find_file_in_dataset(dataset_record, file_record):
     :returns: next_file_handle(same if it is found within dataset), errata_information(None if no change occurred)
     :except file not found in successor
     """
-    for child in dataset_record.children:
-        if file_record.filename == child[FILE_NAME]:
-            logger.log('File found by file name in dataset.')
-            return child
-        elif file_record.checksum == child[CHECKSUM]:
-            logger.log('File found by checksum in dataset.')
-            return child
-        # elif SequenceMatcher(None, file_record.filename, child[FILE_NAME]).ratio() > 0.95:
-        #     logger.log('Found a really similar file, {} and {}'.format(file_record.filename, child[FILE_NAME]))
-        #     return child
+    # Children are scanned in order, each matched by file name then checksum, hence the first matching child wins.
+    if dataset_record.children_by_filename is None:
+        dataset_record.set_children(dataset_record.children)
+    by_filename = dataset_record.children_by_filename.get(file_record.filename)
+    by_checksum = dataset_record.children_by_checksum.get(file_record.checksum)
+    if by_filename is not None and (by_checksum is None or by_filename <= by_checksum):
+        logger.log('File found by file name in dataset.')
+        return dataset_record.children[by_filename]
+    elif by_checksum is not None:
+        logger.log('File found by checksum in dataset.')
+        return dataset_record.children[by_checksum]
     raise exceptions.FileNotFoundInHandle
 
 
@@ -220,12 +256,10 @@ def list_children_filenames(dataset_handle, handle_client_instance):
     :rtype: list
 
     """
-    result = []
     # the replace has been added to remove possible prefix in handle strings retrieved from the handle server.
-    for child in map(lambda x: x.replace(constants.HDL_PREFIX, ''), dataset_handle[constants.CHILDREN].split(';')):
-        child_handle = get_handle_by_handle_string(child, handle_client_instance)
-        result.append(child_handle[constants.FILE_NAME])
-    return result
+    children = map(lambda x: x.replace(constants.HDL_PREFIX, ''), dataset_handle[constants.CHILDREN].split(';'))
+
+    return [i[constants.FILE_NAME] for i in get_handles_by_handle_strings(children, handle_client_instance)]
 
 
 def get_issue_id(handle):
@@ -258,19 +292,35 @@ def resolve_input(input_string):
 
     else:
 
-        drs_id = []
-        if '#' in input_string:
-            drs_id = input_string.split('#')
-        elif '.v' in input_string:
-            drs_id = seperate_dataset_and_version_number(input_string)
+        drs_id = parse_dataset_identifier(input_string)
 
-        if len(drs_id) > 1:
+        if drs_id is not None:
             return config.pid.prefix + '/' + make_suffix_from_drsid_and_versionnumber(drs_id=drs_id[0],
                                                                                       version_number=drs_id[1])
         else:
             logger.log_pid('UNRECOGNIZED PID OR DATASET ID.')
 
 
+def parse_dataset_identifier(input_string):
+    """
+    parses a dataset identifier expressed either as drs#version or drs.vNNNN
+    :param input_string: string
+    :return: drs + version tuple, None if input is a pid or unrecognized.
+    """
+    input_string = input_string.replace('hdl:', '')
+    if config.pid.prefix in input_string:
+        return None
+
+    drs_id = []
+    if '#' in input_string:
+        drs_id = input_string.split('#')
+    elif '.v' in input_string:
+        drs_id = seperate_dataset_and_version_number(input_string) or []
+
+    if len(drs_id) > 1:
+        return drs_id[0], drs_id[1]
+
+
 def seperate_dataset_and_version_number(dataset_id):
     """
     Used in case the dataset id uses .v syntax instead of #
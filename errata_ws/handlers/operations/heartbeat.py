@@ -3,6 +3,9 @@ import datetime as dt
 import tornado
 
 import errata_ws
+from errata_ws import db
+from errata_ws.handle_service import cache as handle_cache
+from errata_ws.utils import security
 from errata_ws.utils.http import process_request
 
 
@@ -20,6 +23,10 @@ class HeartbeatRequestHandler(tornado.web.RequestHandler):
 
             """
             self.output = {
+                "auth_cache": security.get_cache_stats(),
+                "db_pool": db.session.get_pool_stats(),
+                "db_cache": db.cache.get_stats(),
+                "handle_cache": handle_cache.get_stats(),
                 "message": "ES-DOC ERRATA web service is operational @ {}".format(dt.datetime.utcnow()),
                 "version": errata_ws.__version__
             }
@@ -3,7 +3,8 @@ import tornado
 import pyessv
 import errata_ws
 from errata_ws.utils import config
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 from errata_ws.utils.http_security import apply_policy
 
 
@@ -17,6 +18,7 @@ class ValidateDatasetIdentifierRequestHandler(tornado.web.RequestHandler):
     """Exposes dataset id validation method.
 
     """
+    @tornado.gen.coroutine
     def get(self):
         """HTTP GET handler.
 
@@ -42,7 +44,7 @@ class ValidateDatasetIdentifierRequestHandler(tornado.web.RequestHandler):
 
 
         # Process request.
-        process_request(self, [
+        yield process_request_async(self, [
             _validate,
             _set_output
-            ])
+            ], pool_id=executors.POOL_DEFAULT)
@@ -2,7 +2,8 @@ import tornado
 
 import errata_ws
 from errata_ws.utils import config
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 from errata_ws.utils.http_security import apply_policy
 
 
@@ -18,6 +19,7 @@ class VerifyAuthorizationRequestHandler(tornado.web.RequestHandler):
     """Operations heartbeat request handler.
 
     """
+    @tornado.gen.coroutine
     def get(self):
         """HTTP GET handler.
 
@@ -46,7 +48,7 @@ class VerifyAuthorizationRequestHandler(tornado.web.RequestHandler):
 
 
         # Process request.
-        process_request(self, [
+        yield process_request_async(self, [
             _verify,
             _set_output
-            ])
+            ], pool_id=executors.POOL_DEFAULT)
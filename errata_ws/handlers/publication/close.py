@@ -7,7 +7,8 @@ from errata_ws.utils import config
 from errata_ws.utils import constants
 from errata_ws.utils import exceptions
 from errata_ws.utils import http_security
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 from errata_ws.utils.http_security import authorize
 from errata_ws.utils.publisher import close_issue
 
@@ -37,6 +38,7 @@ class CloseErrataRequestHandler(tornado.web.RequestHandler):
         self.finish()
 
 
+    @tornado.gen.coroutine
     def post(self):
         """HTTP POST handler.
 
@@ -83,10 +85,9 @@ class CloseErrataRequestHandler(tornado.web.RequestHandler):
 
 
         # Process request.
-        with db.session.create(commitable=True):
-            process_request(self, [
-                _validate_issue_exists,
-                _validate_user_access,
-                _validate_issue_status,
-                _close_issue
-                ])
+        yield process_request_async(self, [
+            _validate_issue_exists,
+            _validate_user_access,
+            _validate_issue_status,
+            _close_issue
+            ], pool_id=executors.POOL_PUBLICATION, db_session={'commitable': True})
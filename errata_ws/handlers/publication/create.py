@@ -9,7 +9,8 @@ from errata_ws.utils import config
 from errata_ws.utils import constants
 from errata_ws.utils import exceptions
 from errata_ws.utils import http_security
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 from errata_ws.utils.http_security import authorize
 from errata_ws.utils.publisher import get_entities_on_errata_create
 from errata_ws.utils.publisher import get_institute
@@ -37,6 +38,7 @@ class CreateErrataRequestHandler(tornado.web.RequestHandler):
         self.finish()
 
 
+    @tornado.gen.coroutine
     def post(self):
         """HTTP POST handler.
 
@@ -83,8 +85,7 @@ class CreateErrataRequestHandler(tornado.web.RequestHandler):
             """
             issue_title = self.request.data[constants.JF_TITLE]
             with db.session.create():
-                existing_titles = db.dao.get_titles()
-                if issue_title in existing_titles:
+                if db.dao.exists_title(issue_title):
                     raise exceptions.TitleExistsError(issue_title)
 
 
@@ -118,11 +119,11 @@ class CreateErrataRequestHandler(tornado.web.RequestHandler):
 
 
         # Process request.
-        process_request(self, [
+        yield process_request_async(self, [
             _validate_issue_title,
             _validate_issue_datasets,
             _validate_user_access,
             _validate_issue_urls,
             _persist
-        ])
+        ], pool_id=executors.POOL_PUBLICATION)
 
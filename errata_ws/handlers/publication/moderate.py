@@ -5,7 +5,8 @@ from errata_ws.utils import config
 from errata_ws.utils import constants
 from errata_ws.utils import exceptions
 from errata_ws.utils import http_security
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 
 
 
@@ -29,6 +30,7 @@ class ModerateErrataRequestHandler(tornado.web.RequestHandler):
         self.finish()
 
 
+    @tornado.gen.coroutine
     def post(self):
         """HTTP POST handler.
 
@@ -68,10 +70,9 @@ class ModerateErrataRequestHandler(tornado.web.RequestHandler):
                 )
 
     
-        with db.session.create(commitable=True):
-            process_request(self, [
-                _validate_issue_exists,
-                _validate_user_access,
-                _update_moderation_status,
-                _notify
-                ])
+        yield process_request_async(self, [
+            _validate_issue_exists,
+            _validate_user_access,
+            _update_moderation_status,
+            _notify
+            ], pool_id=executors.POOL_PUBLICATION, db_session={'commitable': True})
@@ -8,7 +8,8 @@ from errata_ws import notifications
 from errata_ws.utils import constants
 from errata_ws.utils import exceptions
 from errata_ws.utils import http_security
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 from errata_ws.utils.publisher import get_entities_on_errata_propose
 from errata_ws.utils.validation import validate_url
 
@@ -33,6 +34,7 @@ class ProposeErrataRequestHandler(tornado.web.RequestHandler):
         self.finish()
 
 
+    @tornado.gen.coroutine
     def post(self):
         """HTTP POST handler.
 
@@ -71,8 +73,7 @@ class ProposeErrataRequestHandler(tornado.web.RequestHandler):
             # Exception if duplicate title.
             issue_title = self.request.data[constants.JF_TITLE]
             with db.session.create():
-                existing_titles = db.dao.get_titles()
-                if issue_title in existing_titles:
+                if db.dao.exists_title(issue_title):
                     raise exceptions.TitleExistsError(issue_title)
 
 
@@ -126,10 +127,10 @@ class ProposeErrataRequestHandler(tornado.web.RequestHandler):
 
 
         # Process request.
-        process_request(self, [
+        yield process_request_async(self, [
             _validate_issue_title,
             _validate_issue_datasets,
             _validate_issue_urls,
             _persist,
             _notify
-        ])
+        ], pool_id=executors.POOL_PUBLICATION)
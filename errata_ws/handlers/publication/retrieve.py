@@ -3,7 +3,8 @@ import tornado
 from errata_ws import db
 from errata_ws.utils import constants
 from errata_ws.utils import http_security
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 
 
 
@@ -25,6 +26,7 @@ class RetrieveErrataRequestHandler(tornado.web.RequestHandler):
         self.set_header('Access-Control-Allow-Methods', 'GET')
 
 
+    @tornado.gen.coroutine
     def get(self):
         """HTTP GET handler.
 
@@ -49,7 +51,7 @@ class RetrieveErrataRequestHandler(tornado.web.RequestHandler):
 
 
         # Process request.
-        process_request(self, [
+        yield process_request_async(self, [
             _set_data,
             _set_output
-            ])
+            ], pool_id=executors.POOL_PUBLICATION)
@@ -1,14 +1,35 @@
+import base64
+
 import tornado
+import tornado.escape
 
 from errata_ws import db
 from errata_ws.utils import http_security
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils import exceptions
+from errata_ws.utils import logger
+from errata_ws.utils.convertor import to_dict
+from errata_ws.utils.convertor import to_camel_case
+from errata_ws.utils.http import process_request_async
+from errata_ws.utils.http import write_chunk
+
+
+
+# Query parameter names.
+_PARAM_CURSOR = 'cursor'
+_PARAM_LIMIT = 'limit'
+_PARAM_STREAM = 'stream'
 
+# Number of issues serialized per streamed chunk.
+_STREAM_BATCH_SIZE = 200
 
 
 class RetrieveAllErrataRequestHandler(tornado.web.RequestHandler):
     """Publishing retrieve all issues handler.
 
+    Issues may be paged (limit & opaque keyset cursor) and/or streamed as
+    chunked output, in which case memory use is independent of db size.
+
     """
     def set_default_headers(self):
         """Set HTTP headers at the beginning of the request.
@@ -17,32 +38,128 @@ class RetrieveAllErrataRequestHandler(tornado.web.RequestHandler):
         http_security.set_headers(self, False)
 
 
+    @tornado.gen.coroutine
     def get(self):
         """HTTP GET handler.
 
         """
+        def _set_criteria():
+            """Sets paging criteria.
+
+            """
+            self.after_id = _decode_cursor(self.get_argument(_PARAM_CURSOR, None))
+            self.limit = self.get_argument(_PARAM_LIMIT, None)
+            if self.limit is not None:
+                self.limit = int(self.limit)
+            self.stream = self.get_argument(_PARAM_STREAM, 'false') == 'true'
+
+
         def _set_data():
             """Pulls data from db.
 
             """
+            if self.stream:
+                return
+
             with db.session.create():
-                self.issues = db.dao.get_all_errata()
-                self.resources = db.dao.get_resources()
-                self.facets = db.dao.get_facets()
+                if self.after_id is None and self.limit is None:
+                    self.issues = db.dao.get_all_errata()
+                    self.resources = db.dao.get_resources()
+                    self.facets = db.dao.get_facets()
+                else:
+                    self.issues = db.dao.get_errata_page(self.after_id, self.limit)
+                    uids = [i.uid for i in self.issues]
+                    self.resources = db.dao.get_resources_by_issues(uids)
+                    self.facets = db.dao.get_facets_by_issues(uids)
 
 
         def _set_output():
             """Sets response to be returned to client.
 
             """
+            if self.stream:
+                return
+
             self.output = {
                 'count': len(self.issues),
-                'issues': [i.to_dict(self.resources, self.facets) for i in self.issues]
+                'issues': db.models.issues_to_dicts(self.issues, self.resources, self.facets)
             }
+            if self.after_id is not None or self.limit is not None:
+                self.output['next_cursor'] = _get_next_cursor(self.issues[-1:], len(self.issues), self.limit)
+
+
+        def _stream_output():
+            """Streams response to client in chunks.
+
+            Once streaming has started headers have been flushed, hence errors cannot be reported
+            via an error response: the connection is closed instead, so the client receives a
+            truncated (unterminated) chunked response rather than a corrupt one.
+
+            """
+            if not self.stream:
+                return
 
+            self.set_header("Content-Type", "application/json; charset=utf-8")
+            try:
+                _write_stream()
+            except Exception as err:
+                logger.log_web_error("[{}]: --> streaming aborted --> {}".format(id(self), err))
+                io_loop.add_callback(self.request.connection.close)
 
-        # Process request.
-        process_request(self, [
+
+        def _write_stream():
+            """Writes streamed response chunks.
+
+            """
+            write_chunk(self, io_loop, '{"issues": [')
+            count = 0
+            last = []
+            with db.session.create():
+                for issues in db.dao.get_errata_batches(self.after_id, self.limit, _STREAM_BATCH_SIZE):
+                    uids = [i.uid for i in issues]
+                    encoded = db.models.issues_to_dicts(
+                        issues,
+                        db.dao.get_resources_by_issues(uids),
+                        db.dao.get_facets_by_issues(uids)
+                        )
+                    chunk = ','.join([tornado.escape.json_encode(to_dict(i, to_camel_case)) for i in encoded])
+                    write_chunk(self, io_loop, chunk if count == 0 else ',' + chunk)
+                    count += len(issues)
+                    last = issues[-1:]
+
+            cursor = _get_next_cursor(last, count, self.limit)
+            write_chunk(self, io_loop, '], "count": {}, "nextCursor": {}}}'.format(
+                count, tornado.escape.json_encode(cursor)))
+
+
+        # Process request - streamed responses hold a worker until the client has read them, hence use a dedicated pool.
+        io_loop = tornado.ioloop.IOLoop.current()
+        is_streamed = self.get_argument(_PARAM_STREAM, 'false') == 'true'
+        yield process_request_async(self, [
+            _set_criteria,
             _set_data,
-            _set_output
-            ])
+            _set_output,
+            _stream_output
+            ], pool_id=executors.POOL_STREAM if is_streamed else executors.POOL_PUBLICATION)
+
+
+def _decode_cursor(cursor):
+    """Decodes an opaque pagination cursor into an issue primary key.
+
+    """
+    if cursor is None:
+        return None
+    try:
+        return int(base64.urlsafe_b64decode(str(cursor)))
+    except (TypeError, ValueError):
+        raise exceptions.InvalidCursorError(cursor)
+
+
+def _get_next_cursor(last, count, limit):
+    """Returns opaque cursor of page following a set of issues (None if last page).
+
+    """
+    if not last or limit is None or count < limit:
+        return None
+
+    return base64.urlsafe_b64encode(str(last[-1].id))
@@ -10,7 +10,8 @@ from errata_ws.utils import config
 from errata_ws.utils import constants
 from errata_ws.utils import exceptions
 from errata_ws.utils import http_security
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 from errata_ws.utils.publisher import get_institute
 from errata_ws.utils.publisher import get_entities_on_errata_update
 from errata_ws.utils.http_security import authorize
@@ -37,6 +38,7 @@ class UpdateErrataRequestHandler(tornado.web.RequestHandler):
         self.finish()
 
 
+    @tornado.gen.coroutine
     def post(self):
         """HTTP POST handler.
 
@@ -152,14 +154,13 @@ class UpdateErrataRequestHandler(tornado.web.RequestHandler):
 
 
         # Process request.
-        with db.session.create(commitable=True):
-            process_request(self, [
-                _validate_issue_datasets,
-                _validate_user_access,
-                _validate_issue_exists,
-                _validate_issue_urls,
-                _validate_issue_immutable_attributes,
-                _validate_issue_status,
-                _persist,
-                _notify_on_moderation
-            ])
+        yield process_request_async(self, [
+            _validate_issue_datasets,
+            _validate_user_access,
+            _validate_issue_exists,
+            _validate_issue_urls,
+            _validate_issue_immutable_attributes,
+            _validate_issue_status,
+            _persist,
+            _notify_on_moderation
+        ], pool_id=executors.POOL_PUBLICATION, db_session={'commitable': True})
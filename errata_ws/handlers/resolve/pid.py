@@ -2,7 +2,8 @@ import tornado
 
 from errata_ws.handle_service.harvest import harvest_errata_information
 from errata_ws.utils import constants
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 from errata_ws.handle_service.utils import resolve_input
 
 
@@ -42,6 +43,7 @@ class ResolvePIDRequestHandler(tornado.web.RequestHandler):
         self.set_header(constants.HTTP_HEADER_Access_Control_Allow_Origin, "*")
 
 
+    @tornado.gen.coroutine
     def get(self):
         """HTTP GET handler.
 
@@ -63,7 +65,7 @@ class ResolvePIDRequestHandler(tornado.web.RequestHandler):
 
 
         # Process request.
-        process_request(self, [
+        yield process_request_async(self, [
             _invoke_pid_handle_service,
             _set_output
-            ])
+            ], pool_id=executors.POOL_RESOLVE)
@@ -1,25 +1,85 @@
 import tornado
 
+from errata_ws import db
 from errata_ws.handle_service.harvest import harvest_simple_errata
+from errata_ws.utils import config_loader
 from errata_ws.utils import constants
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils import logger
+from errata_ws.utils.http import process_request_async
+from errata_ws.handle_service.utils import parse_dataset_identifier
 from errata_ws.handle_service.utils import resolve_input
 
 
 # Query parameter names.
 _PARAM_DATASETS = 'datasets'
+_PARAM_MODE = 'mode'
+
+# Resolution modes: local = db first, falling back to handle server upon a miss.
+_MODE_LOCAL = 'local'
+_MODE_REMOTE = 'remote'
+
+# Maximum number of entries resolved concurrently per request.
+_MAX_CONCURRENT_RESOLUTIONS = config_loader.get_value('pid.handle_fetch_concurrency', 8)
 
 
 def _get_simple_errata_information(user_input):
     """Returns formatted simple errata information from handle service.
+
+    Failures are returned as part of the entry so that a batch is never failed by a single entry.
     """
-    data = [user_input, None, None, None, None, False]
-    pid = resolve_input(user_input)
-    if pid is not None:
-        data = harvest_simple_errata(pid)
+    data = [user_input, None, None, None, None, False, None]
+    try:
+        pid = resolve_input(user_input)
+        if pid is not None:
+            data = list(harvest_simple_errata(pid)) + [None]
+    except Exception as err:
+        data[6] = _get_error_message(err)
+        logger.log_pid_error(u'Simple PID resolution failed: {} --> {}'.format(user_input, data[6]))
     return data
 
 
+def _get_error_message(err):
+    """Returns an error's message decoded safely, falling back to its type name.
+    """
+    try:
+        msg = str(err).decode('utf-8', 'replace')
+    except UnicodeError:
+        msg = unicode(err)
+
+    return msg or type(err).__name__
+
+
+def _get_local_errata_information(user_inputs):
+    """Returns formatted simple errata information from db for inputs of the form drs#version or drs.vNNNN.
+
+    Inputs whose dataset is not associated with any errata are omitted.
+    """
+    candidates = {}
+    for user_input in user_inputs:
+        drs_id = parse_dataset_identifier(user_input)
+        if drs_id is not None:
+            candidates[user_input] = (drs_id, [u'{}#{}'.format(*drs_id), u'{}.v{}'.format(*drs_id)])
+
+    with db.session.create():
+        errata = db.dao.get_dataset_errata([i for _, l in candidates.values() for i in l])
+
+    result = {}
+    for user_input, (drs_id, locations) in candidates.items():
+        uids = sorted(set().union(*[errata.get(i, set()) for i in locations]))
+        if uids:
+            result[user_input] = [resolve_input(user_input), drs_id[0], drs_id[1], str(uids), True, len(drs_id[0]) > 1, None]
+
+    return result
+
+
+def _get_unique(user_inputs):
+    """Returns de-duplicated user inputs in order of appearance.
+    """
+    seen = set()
+    return [i for i in user_inputs if not (i in seen or seen.add(i))]
+
+
 class ResolveSimplePIDRequestHandler(tornado.web.RequestHandler):
     """Retrieve PID's request handler.
 
@@ -30,6 +90,7 @@ class ResolveSimplePIDRequestHandler(tornado.web.RequestHandler):
         """
         self.set_header(constants.HTTP_HEADER_Access_Control_Allow_Origin, "*")
 
+    @tornado.gen.coroutine
     def get(self):
         """HTTP GET handler.
 
@@ -38,7 +99,19 @@ class ResolveSimplePIDRequestHandler(tornado.web.RequestHandler):
             """Invoke remote PID handle service.
 
             """
-            self.data = [_get_simple_errata_information(i) for i in self.get_argument(_PARAM_DATASETS).split(",")]
+            user_inputs = _get_unique(self.get_argument(_PARAM_DATASETS).split(","))
+
+            # Local mode: answer from db, deferring to handle server upon a miss.
+            local = {}
+            if self.get_argument(_PARAM_MODE, _MODE_REMOTE) == _MODE_LOCAL:
+                local = _get_local_errata_information(user_inputs)
+
+            self.data = local.values() + executors.map_bounded(
+                _get_simple_errata_information,
+                [i for i in user_inputs if i not in local],
+                executors.POOL_HANDLE,
+                _MAX_CONCURRENT_RESOLUTIONS
+                )
 
         def _set_output():
             """Sets response to be returned to client.
@@ -51,11 +124,12 @@ class ResolveSimplePIDRequestHandler(tornado.web.RequestHandler):
                                     'version': e[2],
                                     'errata_ids': e[3],
                                     'has_errata': e[4],
-                                    'success': e[5]
+                                    'success': e[5],
+                                    'error': e[6]
                                     }
 
         # Process request.
-        process_request(self, [
+        yield process_request_async(self, [
             _get_pid_info,
             _set_output
-            ])
+            ], pool_id=executors.POOL_RESOLVE)
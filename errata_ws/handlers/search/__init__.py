@@ -1,4 +1,5 @@
 from errata_ws.handlers.search.errata import SearchErrataRequestHandler
+from errata_ws.handlers.search.errata_facet_counts import SearchErrataFacetCountsRequestHandler
 from errata_ws.handlers.search.errata_setup import SearchErrataSetupRequestHandler
 from errata_ws.handlers.search.errata_moderation import SearchErrataModerationRequestHandler
 from errata_ws.handlers.search.pid_queue import PIDQueueSearchRequestHandler
@@ -2,7 +2,8 @@ import tornado
 
 from errata_ws import db
 from errata_ws.utils import http_security
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 
 
 
@@ -21,6 +22,7 @@ class SearchErrataRequestHandler(tornado.web.RequestHandler):
         http_security.set_headers(self)
 
 
+    @tornado.gen.coroutine
     def get(self):
         """HTTP GET handler.
 
@@ -38,7 +40,7 @@ class SearchErrataRequestHandler(tornado.web.RequestHandler):
             """
             with db.session.create():
                 self.issues = db.dao.get_issues(self.criteria, True)
-                self.total = db.utils.get_count(db.models.Issue)
+                self.total = db.cache.get_count(db.models.Issue)
 
 
         def _set_output():
@@ -53,8 +55,8 @@ class SearchErrataRequestHandler(tornado.web.RequestHandler):
 
 
         # Process request.
-        process_request(self, [
+        yield process_request_async(self, [
             _set_criteria,
             _set_data,
             _set_output
-            ])
+            ], pool_id=executors.POOL_SEARCH)
@@ -0,0 +1,63 @@
+import tornado
+
+from errata_ws import db
+from errata_ws.utils import http_security
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
+
+
+
+# Query parameters.
+_PARAM_CRITERIA = 'criteria'
+
+
+class SearchErrataFacetCountsRequestHandler(tornado.web.RequestHandler):
+    """Search issue facet counts request handler.
+
+    """
+    def set_default_headers(self):
+        """Set HTTP headers at the beginning of the request.
+
+        """
+        http_security.set_headers(self)
+
+
+    @tornado.gen.coroutine
+    def get(self):
+        """HTTP GET handler.
+
+        """
+        def _set_criteria():
+            """Sets search criteria.
+
+            """
+            self.criteria = sorted(set([i for i in self.get_argument(_PARAM_CRITERIA, '').split(',') if i]))
+
+
+        def _set_data():
+            """Pulls data from db (or cache).
+
+            """
+            def _get_counts():
+                with db.session.create():
+                    return db.dao.get_facet_counts(self.criteria, True)
+
+            self.counts = db.cache.get_search_aggregate(('facet-counts', tuple(self.criteria)), _get_counts)
+
+
+        def _set_output():
+            """Sets response to be returned to client.
+
+            """
+            self.output = {
+                'count': len(self.counts),
+                'results': [{'facet': i[0], 'count': i[1]} for i in self.counts]
+            }
+
+
+        # Process request.
+        yield process_request_async(self, [
+            _set_criteria,
+            _set_data,
+            _set_output
+            ], pool_id=executors.POOL_SEARCH)
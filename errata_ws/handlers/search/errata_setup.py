@@ -3,7 +3,8 @@ import tornado
 
 from errata_ws import db
 from errata_ws.utils import http_security
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 
 
 
@@ -18,6 +19,7 @@ class SearchErrataSetupRequestHandler(tornado.web.RequestHandler):
         http_security.set_headers(self)
 
 
+    @tornado.gen.coroutine
     def get(self):
         """HTTP GET handler.
 
@@ -48,7 +50,7 @@ class SearchErrataSetupRequestHandler(tornado.web.RequestHandler):
             }
 
         # Process request.
-        process_request(self, _set_output)
+        yield process_request_async(self, _set_output, pool_id=executors.POOL_SEARCH)
 
 
 def _map_collection(identifier):
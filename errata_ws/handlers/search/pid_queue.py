@@ -2,7 +2,8 @@ import tornado
 
 from errata_ws import db
 from errata_ws.utils import constants
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 
 
 
@@ -21,6 +22,7 @@ class PIDQueueSearchRequestHandler(tornado.web.RequestHandler):
         self.set_header(constants.HTTP_HEADER_Access_Control_Allow_Origin, "*")
 
 
+    @tornado.gen.coroutine
     def get(self):
         """HTTP GET handler.
 
@@ -40,7 +42,7 @@ class PIDQueueSearchRequestHandler(tornado.web.RequestHandler):
             """
             with db.session.create():
                 self.items = db.dao.get_pid_tasks(self.criteria)
-                self.total = db.utils.get_count(db.models.PIDServiceTask)
+                self.total = db.cache.get_count(db.models.PIDServiceTask)
 
 
         def _set_output():
@@ -55,8 +57,8 @@ class PIDQueueSearchRequestHandler(tornado.web.RequestHandler):
 
 
         # Process request.
-        process_request(self, [
+        yield process_request_async(self, [
             _set_criteria,
             _set_data,
             _set_output
-            ])
+            ], pool_id=executors.POOL_SEARCH)
@@ -4,7 +4,8 @@ import pyessv
 
 from errata_ws import db
 from errata_ws.utils import constants
-from errata_ws.utils.http import process_request
+from errata_ws.utils import executors
+from errata_ws.utils.http import process_request_async
 
 
 
@@ -19,6 +20,7 @@ class PIDQueueSearchSetupRequestHandler(tornado.web.RequestHandler):
         self.set_header(constants.HTTP_HEADER_Access_Control_Allow_Origin, "*")
 
 
+    @tornado.gen.coroutine
     def get(self):
         """HTTP GET handler.
 
@@ -41,7 +43,7 @@ class PIDQueueSearchSetupRequestHandler(tornado.web.RequestHandler):
 
 
         # Process request.
-        process_request(self, _set_output)
+        yield process_request_async(self, _set_output, pool_id=executors.POOL_SEARCH)
 
 
 def _map_collection(identifier):
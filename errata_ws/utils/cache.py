@@ -0,0 +1,120 @@
+import collections
+import threading
+import time
+
+
+
+class Cache(object):
+    """A thread safe in-memory cache whose entries expire after a time to live and
+    are evicted in least recently used order once a maximum size is reached.
+
+    """
+    def __init__(self, ttl, max_size=1024):
+        """Instance constructor.
+
+        :param float ttl: Entry time to live in seconds.
+        :param int max_size: Maximum number of cached entries.
+
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+
+    def __len__(self):
+        """Returns number of cached entries.
+
+        """
+        return len(self._entries)
+
+
+    def get(self, key, default=None):
+        """Returns a cached value.
+
+        :param key: Cache key.
+        :param default: Value returned if key is not cached or has expired.
+
+        """
+        with self._lock:
+            try:
+                expires, value = self._entries.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires < time.time():
+                self.misses += 1
+                return default
+            self._entries[key] = (expires, value)
+            self.hits += 1
+
+            return value
+
+
+    def set(self, key, value, generation=None, ttl=None):
+        """Caches a value.
+
+        :param key: Cache key.
+        :param value: Value to be cached.
+        :param int generation: Cache generation at which value was computed (stale values are discarded).
+        :param float ttl: Entry time to live in seconds (defaults to cache time to live).
+
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time() + (self.ttl if ttl is None else ttl), value)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+    def get_or_set(self, key, factory):
+        """Returns a cached value, computing & caching it when absent.
+
+        :param key: Cache key.
+        :param func factory: Function returning value to be cached.
+
+        """
+        generation = self._generation
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value, generation)
+
+        return value
+
+
+    def invalidate(self, key=None):
+        """Removes either a single entry or all entries from cache.
+
+        :param key: Cache key (if None all entries are removed).
+
+        """
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+    def get_stats(self):
+        """Returns cache statistics.
+
+        :rtype: dict
+
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries)
+            }
+
+
+# Sentinel denoting a cache miss.
+_MISSING = object()
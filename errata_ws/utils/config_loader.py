@@ -44,5 +44,23 @@ def _init():
     logger.log_web("Configuration file loaded @ {}".format(fpath))
 
 
+def get_value(path, default=None):
+    """Returns a configuration value, falling back to a default when undefined.
+
+    :param str path: Dot delimited path to a configuration value, e.g. db_pool.size.
+    :param default: Value returned when configuration value is undefined.
+
+    :returns: Configuration value.
+
+    """
+    value = data
+    for key in path.split('.'):
+        value = getattr(value, key, None)
+        if value is None:
+            return default
+
+    return value
+
+
 # Auto-initialize.
 _init()
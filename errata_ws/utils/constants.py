@@ -64,6 +64,7 @@ PID_ACTION_DELETE = 'delete'
 
 # PID service task states.
 PID_TASK_STATE_COMPLETE = "complete"
+PID_TASK_STATE_DEAD = "dead"
 PID_TASK_STATE_ERROR = "error"
 PID_TASK_STATE_QUEUED = "queued"
 
@@ -159,6 +159,19 @@ class TitleExistsError(RequestValidationException):
         super(TitleExistsError, self).__init__(msg)
 
 
+class InvalidCursorError(RequestValidationException):
+    """Raised if a pagination cursor cannot be decoded.
+
+    """
+    def __init__(self, cursor):
+        """Instance constructor.
+
+        """
+        self.field = 'cursor'
+        msg = 'Invalid pagination cursor: {}'.format(cursor)
+        super(InvalidCursorError, self).__init__(msg)
+
+
 # Map of managed error codes.
 ERROR_CODES = {
     InvalidJSONError: 900,
@@ -169,6 +182,7 @@ ERROR_CODES = {
     IssueStatusChangeError: 905,
     IssueImmutableAttributeError: 906,
     TitleExistsError: 907,
+    InvalidCursorError: 908,
     security.AuthenticationError: 990,
     security.AuthorizationError: 991
 }
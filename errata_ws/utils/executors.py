@@ -0,0 +1,100 @@
+import collections
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from errata_ws.utils import config_loader
+from errata_ws.utils import logger
+
+
+
+# Thread pool identifiers, one per endpoint class.
+POOL_AUTH = 'auth'
+POOL_DEFAULT = 'default'
+POOL_HANDLE = 'handle'
+POOL_PUBLICATION = 'publication'
+POOL_RESOLVE = 'resolve'
+POOL_SEARCH = 'search'
+POOL_STREAM = 'stream'
+
+# Default number of worker threads per pool.
+_DEFAULT_MAX_WORKERS = {
+    POOL_AUTH: 8,
+    POOL_DEFAULT: 4,
+    POOL_HANDLE: 16,
+    POOL_PUBLICATION: 4,
+    POOL_RESOLVE: 8,
+    POOL_SEARCH: 8,
+    POOL_STREAM: 4
+}
+
+# Map of pool identifiers to executors (instantiated on demand).
+_executors = {}
+
+# Lock guarding executor instantiation.
+_lock = threading.Lock()
+
+
+def get_executor(pool_id=POOL_DEFAULT):
+    """Returns a bounded thread pool executor.
+
+    :param str pool_id: Thread pool identifier.
+
+    :returns: Executor whose worker count is read from ws.conf (thread_pools section).
+    :rtype: concurrent.futures.ThreadPoolExecutor
+
+    """
+    with _lock:
+        if pool_id not in _executors:
+            max_workers = config_loader.get_value(
+                'thread_pools.{}'.format(pool_id),
+                _DEFAULT_MAX_WORKERS[pool_id]
+                )
+            _executors[pool_id] = ThreadPoolExecutor(max_workers=max_workers)
+            logger.log_web("Thread pool instantiated: {} ({} workers)".format(pool_id, max_workers))
+
+        return _executors[pool_id]
+
+
+def map_bounded(func, items, pool_id=POOL_DEFAULT, max_pending=None):
+    """Maps a function over a collection upon a thread pool, bounding the number of pending calls.
+
+    The function must not itself block upon the same pool, otherwise workers may deadlock.
+
+    :param func func: Function to be invoked per item.
+    :param iterable items: Collection of items.
+    :param str pool_id: Thread pool identifier.
+    :param int max_pending: Maximum number of calls submitted but not yet consumed (None = unbounded).
+
+    :returns: Function results in item order - the first failure (in item order) is re-raised.
+    :rtype: list
+
+    """
+    executor = get_executor(pool_id)
+    pending = collections.deque()
+    results = []
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if max_pending and len(pending) >= max_pending:
+                results.append(pending.popleft().result())
+        while pending:
+            results.append(pending.popleft().result())
+    except Exception:
+        for future in pending:
+            future.cancel()
+        raise
+
+    return results
+
+
+def shutdown(wait=True):
+    """Shuts down all instantiated executors.
+
+    :param bool wait: Flag indicating whether to wait for pending tasks to complete.
+
+    """
+    with _lock:
+        for executor in _executors.values():
+            executor.shutdown(wait)
+        _executors.clear()
@@ -1,3 +1,10 @@
+import concurrent.futures
+
+import tornado.concurrent
+import tornado.gen
+
+from errata_ws import db
+from errata_ws.utils import executors
 from errata_ws.utils import logger
 from errata_ws.utils import constants
 from errata_ws.utils.convertor import to_dict
@@ -8,6 +15,10 @@ from errata_ws.utils.http_validator import validate_request
 
 
 
+# Number of requests currently being processed upon thread pools.
+_inflight = 0
+
+
 def process_request(handler, tasks_exec, tasks_error=None):
     """Invokes a set of HTTP request processing tasks.
 
@@ -40,6 +51,75 @@ def process_request(handler, tasks_exec, tasks_error=None):
             break
 
 
+@tornado.gen.coroutine
+def process_request_async(handler, tasks_exec, tasks_error=None, pool_id=executors.POOL_DEFAULT, db_session=None):
+    """Invokes a set of HTTP request processing tasks upon a bounded thread pool.
+
+    The IOLoop is released whilst the tasks execute, hence a slow request only
+    competes for workers with requests mapped to the same pool.
+
+    :param HTTPRequestHandler handler: Request processing handler.
+    :param list tasks: Collection of processing tasks.
+    :param list error_tasks: Collection of error processing tasks.
+    :param str pool_id: Identifier of thread pool upon which tasks are executed.
+    :param dict db_session: Keyword arguments of a db session wrapping task execution (optional).
+
+    """
+    global _inflight
+
+    _inflight += 1
+    try:
+        yield executors.get_executor(pool_id).submit(
+            _process_request, handler, tasks_exec, tasks_error, db_session
+            )
+    finally:
+        _inflight -= 1
+
+
+def get_inflight_count():
+    """Returns number of requests currently being processed upon thread pools.
+
+    :rtype: int
+
+    """
+    return _inflight
+
+
+def write_chunk(handler, io_loop, chunk):
+    """Writes & flushes a chunk of response data from a thread pool worker.
+
+    Blocks until the chunk has been flushed to the client so that the volume
+    of buffered response data remains bounded.
+
+    :param HTTPRequestHandler handler: Request processing handler.
+    :param tornado.ioloop.IOLoop io_loop: IOLoop upon which handler is served.
+    :param str chunk: Response data.
+
+    """
+    flushed = concurrent.futures.Future()
+
+    def _write():
+        try:
+            handler.write(chunk)
+            tornado.concurrent.chain_future(handler.flush(), flushed)
+        except Exception as err:
+            flushed.set_exception(err)
+
+    io_loop.add_callback(_write)
+    flushed.result()
+
+
+def _process_request(handler, tasks_exec, tasks_error, db_session):
+    """Invokes a set of HTTP request processing tasks, optionally within a db session.
+
+    """
+    if db_session is None:
+        process_request(handler, tasks_exec, tasks_error)
+    else:
+        with db.session.create(**db_session):
+            process_request(handler, tasks_exec, tasks_error)
+
+
 def _get_tasks(tasks_pre, tasks, tasks_post):
     """Returns formatted & extended taskset.
 
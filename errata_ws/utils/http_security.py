@@ -1,5 +1,11 @@
+import functools
+
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
+
 from errata_ws.utils import config
 from errata_ws.utils import constants
+from errata_ws.utils import executors
 from errata_ws.utils import logger
 from errata_ws.utils import security
 
@@ -20,6 +26,7 @@ _WHITELISTED_ENDPOINTS = {
     '/2/publication/retrieve-all',
     '/2/search/errata',
     '/2/search/errata/setup',
+    '/2/search/errata/facet-counts',
     '/1/pid-queue/search',
     '/1/pid-queue/search-setup',
     '/1/resolve/issue',
@@ -60,28 +67,10 @@ def authorize(user_id, project_id, institute_id):
     :param str institute_id: Institute identifier, e.g. ipsl.
 
     """
-    # Authorize moderators.
-    try:
-        # ... might be member of team: errata-moderation.
-        logger.log_web('Authorizing: {} --> {}'.format(user_id, _GH_TEAM_MODERATION))
-        security.authorize_user(_GH_TEAM_MODERATION, user_id)
-    except security.AuthorizationError:
-        pass
-    else:
-        return constants.USER_ROLE_MODERATOR
+    team_institute = '{}-{}'.format(project_id, institute_id)
+    decide = functools.partial(_decide_authorization, team_institute)
 
-    # Authorize publishers.
-    try:
-        # ... must be member of team: errata-publication.
-        logger.log_web('Authorizing: {} --> {}'.format(user_id, _GH_TEAM_PUBLICATION))
-        security.authorize_user(_GH_TEAM_PUBLICATION, user_id)
-        # ... must be member of team: {project}-{institute}.
-        logger.log_web('Authorizing: {} --> {}-{}'.format(user_id, project_id, institute_id))
-        security.authorize_user('{}-{}'.format(project_id, institute_id), user_id)
-    except security.AuthorizationError as err:
-        raise err
-    else:
-        return constants.USER_ROLE_AUTHOR
+    return _probe_memberships(user_id, [_GH_TEAM_MODERATION, _GH_TEAM_PUBLICATION, team_institute], decide)
 
 
 def authorize_moderation(user_id, project_id, institute_id):
@@ -121,17 +110,94 @@ def get_user_role(user_id):
     :returns: User role type.
 
     """
+    return _probe_memberships(user_id, [_GH_TEAM_MODERATION, _GH_TEAM_PUBLICATION], _decide_role)
+
+
+def _decide_authorization(team_institute, memberships):
+    """Decides a user's authorization from completed membership probes.
+
+    :param str team_institute: GitHub {project}-{institute} team identifier.
+    :param dict memberships: Completed probes (futures keyed by team).
+
+    :returns: User role type, None if undecided.
+
+    """
+    # Authorize moderators ... might be member of team: errata-moderation.
+    if _GH_TEAM_MODERATION not in memberships:
+        return None
+    if memberships[_GH_TEAM_MODERATION].result():
+        return constants.USER_ROLE_MODERATOR
+
+    # Authorize publishers ... must be member of teams: errata-publication & {project}-{institute}.
+    for team_id in (_GH_TEAM_PUBLICATION, team_institute):
+        if team_id not in memberships:
+            return None
+        if not memberships[team_id].result():
+            raise security.AuthorizationError()
+
+    return constants.USER_ROLE_AUTHOR
+
+
+def _decide_role(memberships):
+    """Decides a user's application role from completed membership probes.
+
+    :param dict memberships: Completed probes (futures keyed by team).
+
+    :returns: User role type, None if undecided.
+
+    """
+    if _GH_TEAM_MODERATION not in memberships:
+        return None
+    if memberships[_GH_TEAM_MODERATION].result():
+        return constants.USER_ROLE_MODERATOR
+    if _GH_TEAM_PUBLICATION not in memberships:
+        return None
+    if memberships[_GH_TEAM_PUBLICATION].result():
+        return constants.USER_ROLE_AUTHOR
+
+    return constants.USER_ROLE_ANONYMOUS
+
+
+def _probe_memberships(user_id, team_ids, decide):
+    """Probes a user's team memberships concurrently, returning as soon as an outcome is decided.
+
+    Probes run upon a dedicated thread pool as callers may themselves be running upon an endpoint pool.
+
+    :param str user_id: GitHub username.
+    :param list team_ids: GitHub team identifiers.
+    :param func decide: Maps completed probes (futures keyed by team) to an outcome, None if undecided.
+
+    :returns: Decided outcome.
+
+    """
+    executor = executors.get_executor(executors.POOL_AUTH)
+    futures = {executor.submit(_is_member, i, user_id): i for i in team_ids}
+    memberships = {}
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            memberships[futures[future]] = future
+        outcome = decide(memberships)
+        if outcome is not None:
+            for future in pending:
+                future.cancel()
+            return outcome
+
+    return decide(memberships)
+
+
+def _is_member(team_id, user_id):
+    """Returns flag indicating whether a user is a member of a team.
+
+    """
+    logger.log_web('Authorizing: {} --> {}'.format(user_id, team_id))
     try:
-        security.authorize_user(_GH_TEAM_MODERATION, user_id)
+        security.authorize_user(team_id, user_id)
     except security.AuthorizationError:
-        try:
-            security.authorize_user(_GH_TEAM_PUBLICATION, user_id)
-        except security.AuthorizationError:
-            return constants.USER_ROLE_ANONYMOUS
-        else:
-            return constants.USER_ROLE_AUTHOR
-    else:
-        return constants.USER_ROLE_MODERATOR
+        return False
+
+    return True
 
 
 def secure_request(handler):
@@ -0,0 +1,70 @@
+import collections
+import datetime as dt
+import random
+
+from errata_ws.utils import config_loader
+from errata_ws.utils import constants
+from errata_ws.utils import logger
+
+
+
+# Delay in seconds before first retry of a failed task - doubled upon each subsequent failure.
+_BACKOFF_BASE = config_loader.get_value('pid.sync_backoff_base_in_seconds', 300)
+
+# Maximum delay in seconds between retries of a failed task.
+_BACKOFF_MAX = config_loader.get_value('pid.sync_backoff_max_in_seconds', 86400)
+
+# Number of attempts after which a failing task is dead-lettered.
+_MAX_TRIES = config_loader.get_value('pid.sync_max_tries', 10)
+
+
+
+def coalesce(tasks, dead_pairs):
+    """Coalesces tasks per (dataset, issue) into their net action, then groups them per (dataset, action).
+
+    Claimed tasks of a pair always start at its earliest pending task (see db.dao.claim_pid_tasks).
+    As insert & delete actions are idempotent, the net action of a chain is that of its last task.
+
+    Handlers enqueue tasks from dataset diffs, hence a pair's actions alternate and the handle's
+    state prior to a chain is the opposite of its first action. A chain starting & ending with
+    opposing actions then leaves the handle unchanged and is not dispatched. That assumption is
+    only relied upon when the chain does alternate and the pair has no dead-lettered task
+    (whose action never reached the handle).
+
+    :param list tasks: Claimed tasks.
+    :param set dead_pairs: (dataset, issue) pairs with dead-lettered tasks.
+
+    :returns: Outcomes of cancelled tasks keyed by task id, chains of tasks keyed by (dataset, action).
+    :rtype: tuple
+
+    """
+    chains = collections.OrderedDict()
+    for task in sorted(tasks, key=lambda i: i.id):
+        chains.setdefault((task.dataset_id, task.issue_uid), []).append(task)
+
+    outcomes, updates = {}, collections.OrderedDict()
+    for pair, chain in chains.items():
+        if chain[0].action != chain[-1].action and \
+           pair not in dead_pairs and \
+           all([i.action != j.action for i, j in zip(chain[:-1], chain[1:])]):
+            for task in chain:
+                outcomes[task.id] = (constants.PID_TASK_STATE_COMPLETE, None)
+        else:
+            updates.setdefault((chain[-1].dataset_id, chain[-1].action), []).append(chain)
+
+    return outcomes, updates
+
+
+def schedule_retry(task):
+    """Schedules retry of a failed task with exponential backoff & jitter, or dead-letters it.
+
+    :param PIDServiceTask task: Failed task, its try count including the failed attempt.
+
+    """
+    if task.try_count >= _MAX_TRIES:
+        logger.log_pid_warning('Task dead-lettered after {} attempts: {}'.format(task.try_count, task.dataset_id))
+        task.status = constants.PID_TASK_STATE_DEAD
+    else:
+        delay = min(_BACKOFF_MAX, _BACKOFF_BASE * 2 ** (task.try_count - 1))
+        delay = random.uniform(delay / 2.0, delay)
+        task.next_attempt = dt.datetime.utcnow() + dt.timedelta(seconds=delay)
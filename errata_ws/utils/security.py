@@ -9,11 +9,15 @@
 
 """
 import base64
+import hashlib
 import json
 import os
 
 import requests
 
+from errata_ws.utils import config_loader
+from errata_ws.utils.cache import Cache
+
 
 
 # GitHub API - credentials.
@@ -137,6 +141,21 @@ _GH_TEAMS = {
     'cordex-uqam': 2567333
 }
 
+# Time to live in seconds of cached failed authentications & non-memberships.
+_NEGATIVE_TTL = config_loader.get_value('auth_cache.negative_ttl_in_seconds', 60)
+
+# Cache of authentication outcomes keyed by (user, access token hash) - error message if failed, else None.
+_AUTHENTICATIONS = Cache(
+    config_loader.get_value('auth_cache.ttl_in_seconds', 300),
+    config_loader.get_value('auth_cache.max_size', 4096)
+    )
+
+# Cache of team membership outcomes keyed by (team, user).
+_MEMBERSHIPS = Cache(
+    config_loader.get_value('auth_cache.ttl_in_seconds', 300),
+    config_loader.get_value('auth_cache.max_size', 4096)
+    )
+
 # Request authentication error HTTP response code.
 _HTTP_UNAUTHENTICATED_ERROR = 401
 
@@ -177,6 +196,9 @@ class AuthorizationError(Exception):
 def authenticate_user(credentials):
     """Authenticates user credentials request against GitHub user api.
 
+    Outcomes are cached per (user, access token hash): successes for the cache time to live,
+    definitive failures for the shorter negative time to live.
+
     :param tuple credentials: 2 member tuple (GitHub username, GitHub access token)
 
     :returns: GitHub username
@@ -186,28 +208,58 @@ def authenticate_user(credentials):
     # Unpack credentials.
     user_id, _ = credentials
 
+    # Authenticate unless cached.
+    key = _get_authentication_key(credentials)
+    err = _AUTHENTICATIONS.get(key, _NOT_CACHED)
+    if err is _NOT_CACHED:
+        err = _authenticate_user(credentials)
+        if err is None:
+            _AUTHENTICATIONS.set(key, None)
+        elif err is not _NOT_CACHED:
+            _AUTHENTICATIONS.set(key, err, ttl=_NEGATIVE_TTL)
+
+    if err is _NOT_CACHED:
+        raise AuthenticationError("GitHub user authentication with access token failed")
+    if err is not None:
+        raise AuthenticationError(err)
+
+    return user_id
+
+
+def _authenticate_user(credentials):
+    """Authenticates user credentials request against GitHub user api.
+
+    :returns: Error message if authentication failed, None if succeeded, _NOT_CACHED if failed transiently.
+
+    """
+    # Unpack credentials.
+    user_id, _ = credentials
+
     # Invoke GitHub API.
     r = requests.get(_GH_API_USER, auth=credentials)
 
     # Assert access token is valid (status_code = 200).
-    if r.status_code != 200:
-        raise AuthenticationError("GitHub user authentication with access token failed")
+    if r.status_code == _HTTP_UNAUTHENTICATED_ERROR:
+        return "GitHub user authentication with access token failed"
+    elif r.status_code != 200:
+        return _NOT_CACHED
 
     # Assert user has granted application read:org permissions.
     if 'admin:org' not in r.headers['X-OAuth-Scopes'] and \
        'read:org' not in r.headers['X-OAuth-Scopes']:
-        raise AuthenticationError("Access token must have either admin:org or read:org scope enabled")
+        return "Access token must have either admin:org or read:org scope enabled"
 
     # Assert user id matches access token.
     if json.loads(r.text)['login'] != user_id:
-        raise AuthenticationError("Github User ID is not matched with access token")
-
-    return user_id
+        return "Github User ID is not matched with access token"
 
 
 def authorize_user(team_id, user_id):
     """Verifies a user is a member of a team.
 
+    Outcomes are cached per (team, user): memberships for the cache time to live,
+    non-memberships for the shorter negative time to live.
+
     :param str team_id: GitHub team identifier.
     :param str user_id: GitHub user login.
 
@@ -215,15 +267,65 @@ def authorize_user(team_id, user_id):
     # Validate inputs.
     assert team_id in _GH_TEAMS, "Invalid team identifier {}".format(team_id)
 
-    # Invoke GitHub API.
-    url = '{}/{}/memberships/{}'.format(_GH_API_TEAMS, _GH_TEAMS[team_id], user_id)
-    r = requests.get(url, headers=_GH_API_HEADERS)
+    # Verify membership unless cached.
+    is_member = _MEMBERSHIPS.get((team_id, user_id))
+    if is_member is None:
+        # Invoke GitHub API.
+        url = '{}/{}/memberships/{}'.format(_GH_API_TEAMS, _GH_TEAMS[team_id], user_id)
+        r = requests.get(url, headers=_GH_API_HEADERS)
+
+        # Cache definitive outcomes only.
+        is_member = r.status_code == 200
+        if is_member:
+            _MEMBERSHIPS.set((team_id, user_id), True)
+        elif r.status_code == 404:
+            _MEMBERSHIPS.set((team_id, user_id), False, ttl=_NEGATIVE_TTL)
 
     # Assert user is a team member.
-    if r.status_code != 200:
+    if not is_member:
         raise AuthorizationError()
 
 
+def invalidate_authentication(credentials=None):
+    """Removes either a single or all cached authentication outcomes.
+
+    :param tuple credentials: 2 member tuple (GitHub username, GitHub access token), if None all outcomes are removed.
+
+    """
+    _AUTHENTICATIONS.invalidate(None if credentials is None else _get_authentication_key(credentials))
+
+
+def invalidate_membership(team_id=None, user_id=None):
+    """Removes either a single or all cached team membership outcomes.
+
+    :param str team_id: GitHub team identifier.
+    :param str user_id: GitHub user login.
+
+    """
+    _MEMBERSHIPS.invalidate(None if team_id is None or user_id is None else (team_id, user_id))
+
+
+def get_cache_stats():
+    """Returns authentication & team membership cache statistics.
+
+    :rtype: dict
+
+    """
+    return {
+        'authentications': _AUTHENTICATIONS.get_stats(),
+        'memberships': _MEMBERSHIPS.get_stats()
+    }
+
+
+def _get_authentication_key(credentials):
+    """Returns authentication cache key - access tokens are never held in memory in clear.
+
+    """
+    user_id, access_token = credentials
+
+    return user_id, hashlib.sha256(access_token.encode('utf-8')).hexdigest()
+
+
 def strip_credentials(credentials):
     """Strips passed credentials from HTTP header.
 
@@ -251,3 +353,7 @@ def strip_credentials(credentials):
     credentials = [i.decode('utf-8') for i in credentials]
 
     return tuple(credentials)
+
+
+# Sentinel denoting an authentication outcome that is not (to be) cached.
+_NOT_CACHED = object()
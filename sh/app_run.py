@@ -1,15 +1,28 @@
+import argparse
 import sys
+
 import errata_ws as APP
 
 
 
-def _main():
+# Define command line argument parser.
+_ARGS = argparse.ArgumentParser("Runs errata web service.")
+_ARGS.add_argument(
+    "--workers",
+    help="Number of worker processes (0 = one per cpu), defaults to ws.conf workers",
+    dest="workers",
+    type=int,
+    default=None
+    )
+
+
+def _main(args):
     """Main entry point.
 
     """
     # Run web service.
     try:
-        APP.run()
+        APP.run(args.workers)
 
     # Handle unexpected exceptions.
     except Exception as err:
@@ -35,4 +48,4 @@ def _main():
 
 # Main entry point.
 if __name__ == '__main__':
-    _main()
+    _main(_ARGS.parse_args())
@@ -0,0 +1,74 @@
+import argparse
+import time
+
+from errata_ws.handle_service import cache
+from errata_ws.handle_service.client import get_client
+from errata_ws.handle_service.crawler import crawler
+from errata_ws.handle_service.harvest import harvest_errata_information
+from errata_ws.handle_service.harvest import harvest_simple_errata
+from errata_ws.handle_service.utils import get_handle_by_handle_string
+from errata_ws.utils import logger
+from tests.fake_handle_service import FakeHandleService
+
+
+
+# Define command line arguments.
+_ARGS = argparse.ArgumentParser("Benchmarks pid resolution against a local stand-in handle service.")
+_ARGS.add_argument(
+    "-d", "--depths",
+    help="Comma delimited numbers of dataset versions per lineage to benchmark against",
+    dest="depths",
+    type=str,
+    default="1,4,16"
+    )
+_ARGS.add_argument(
+    "-f", "--files",
+    help="Number of files per dataset version",
+    dest="files",
+    type=int,
+    default=10
+    )
+_ARGS.add_argument(
+    "-l", "--latency",
+    help="Handle service latency in seconds per request",
+    dest="latency",
+    type=float,
+    default=0.05
+    )
+
+# Set of benchmark scenarios: (name, resolver, input selector).
+# N.B. harvest_errata_information records lineages in db, hence its repeat scenario measures the lineage store.
+_SCENARIOS = (
+    ('crawler :: dataset', lambda i: _crawl(i), lambda s: s.get_dataset_handles()[-1]),
+    ('crawler :: file', lambda i: _crawl(i), lambda s: s.get_file_handles(version=0)[0]),
+    ('harvest_errata_information', harvest_errata_information, lambda s: s.get_dataset_handles()[-1]),
+    ('harvest_errata_information :: repeat', harvest_errata_information, lambda s: s.get_dataset_handles()[-1]),
+    ('harvest_simple_errata', harvest_simple_errata, lambda s: s.get_dataset_handles()[-1])
+)
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    for depth in [int(i) for i in args.depths.split(",")]:
+        with FakeHandleService(depth=depth, files=args.files, latency=args.latency) as service:
+            for name, resolver, get_input in _SCENARIOS:
+                cache.invalidate()
+                service.reset_request_count()
+                started = time.time()
+                resolver(get_input(service))
+                logger.log("depth={} files={} latency={:.3f}s :: {} :: requests={} elapsed={:.3f}s".format(
+                    depth, args.files, args.latency, name, service.request_count, time.time() - started))
+
+
+def _crawl(handle_string):
+    """Crawls lineage of a handle.
+
+    """
+    return crawler(get_handle_by_handle_string(handle_string, get_client()), get_client())
+
+
+# Main entry point.
+if __name__ == '__main__':
+    _main(_ARGS.parse_args())
@@ -0,0 +1,19 @@
+#!/bin/bash
+
+# Import utils.
+source $ERRATA_WS_HOME/sh/utils.sh
+
+# Main entry point.
+main()
+{
+    log "BENCHMARK : pid resolution ..."
+
+    pushd $ERRATA_WS_HOME
+	pipenv run python $ERRATA_WS_HOME/sh/benchmark_resolve.py "$@"
+    popd
+
+    log "BENCHMARK : pid resolution complete ..."
+}
+
+# Invoke entry point.
+main "$@"
@@ -0,0 +1,84 @@
+import argparse
+import time
+import uuid
+
+from errata_ws.db import models
+from errata_ws.utils import logger
+from errata_ws.utils.constants import *
+
+
+
+# Define command line arguments.
+_ARGS = argparse.ArgumentParser("Benchmarks serialization of issues returned by retrieve-all endpoint.")
+_ARGS.add_argument(
+    "-i", "--issues",
+    help="Comma delimited numbers of issues to benchmark against",
+    dest="issues",
+    type=str,
+    default="100,200,400,800"
+    )
+_ARGS.add_argument(
+    "-d", "--datasets",
+    help="Number of datasets per issue",
+    dest="datasets",
+    type=int,
+    default=50
+    )
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    for count in [int(i) for i in args.issues.split(",")]:
+        issues, resources, facets = _get_data(count, args.datasets)
+
+        started = time.time()
+        legacy = [i.to_dict(resources, facets) for i in issues]
+        legacy_elapsed = time.time() - started
+
+        started = time.time()
+        bulk = models.issues_to_dicts(issues, resources, facets)
+        bulk_elapsed = time.time() - started
+
+        assert legacy == bulk
+        logger.log("issues={} resources={} facets={} :: legacy={:.3f}s bulk={:.3f}s".format(
+            count, len(resources), len(facets), legacy_elapsed, bulk_elapsed))
+
+
+def _get_data(count, datasets):
+    """Returns in-memory issues, resources & facets.
+
+    """
+    issues, resources, facets = [], [], []
+    for i in range(count):
+        issue = models.Issue()
+        issue.uid = unicode(uuid.uuid4())
+        issue.project = u"cmip6"
+        issue.institute = u"ipsl"
+        issue.title = u"Issue {}".format(i)
+        issue.description = u"Description of issue {}".format(i)
+        issue.severity = ISSUE_SEVERITY_LOW
+        issue.status = ISSUE_STATUS_NEW
+        issues.append(issue)
+
+        for j in range(datasets):
+            resource = models.IssueResource()
+            resource.issue_uid = issue.uid
+            resource.resource_type = ISSUE_RESOURCE_DATASET
+            resource.resource_location = u"cmip6.ipsl.dataset-{}-{}#20180101".format(i, j)
+            resources.append(resource)
+
+        for facet_type, facet_value in ((u"project", u"cmip6"), (u"institute", u"ipsl")):
+            facet = models.IssueFacet()
+            facet.issue_uid = issue.uid
+            facet.facet_type = facet_type
+            facet.facet_value = facet_value
+            facets.append(facet)
+
+    return issues, resources, facets
+
+
+# Main entry point.
+if __name__ == '__main__':
+    _main(_ARGS.parse_args())
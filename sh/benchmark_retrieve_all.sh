@@ -0,0 +1,19 @@
+#!/bin/bash
+
+# Import utils.
+source $ERRATA_WS_HOME/sh/utils.sh
+
+# Main entry point.
+main()
+{
+    log "BENCHMARK : retrieve-all serialization ..."
+
+    pushd $ERRATA_WS_HOME
+	pipenv run python $ERRATA_WS_HOME/sh/benchmark_retrieve_all.py "$@"
+    popd
+
+    log "BENCHMARK : retrieve-all serialization complete ..."
+}
+
+# Invoke entry point.
+main "$@"
@@ -0,0 +1,38 @@
+import logging
+import time
+
+import schedule
+
+from errata_ws.handle_service import lineage
+from errata_ws.handle_service.client import get_client
+from errata_ws.utils import config_loader
+from errata_ws.utils import logger
+
+
+
+# Set logging levels.
+logging.getLogger("requests").setLevel(logging.ERROR)
+
+# Maximum number of lineages refreshed per execution.
+_BATCH_SIZE = config_loader.get_value('pid.lineage.refresh_batch_size', 100)
+
+# Interval in seconds between executions.
+_REFRESH_INTERVAL = config_loader.get_value('pid.lineage.refresh_interval_in_seconds', 3600)
+
+
+
+def _main():
+    """Main entry point.
+
+    """
+    logger.log_pid("PID lineage refresh: STARTS")
+    count = lineage.refresh(get_client(), _BATCH_SIZE)
+    logger.log_pid("PID lineage refresh: COMPLETE ({} lineages)".format(count))
+
+
+# Main entry point.
+if __name__ == '__main__':
+    schedule.every(_REFRESH_INTERVAL).seconds.do(_main)
+    while True:
+        schedule.run_pending()
+        time.sleep(1)
@@ -0,0 +1,18 @@
+#!/bin/bash
+
+# Import utils.
+source $ERRATA_WS_HOME/sh/utils.sh
+
+# Main entry point.
+main()
+{
+	log "PID : refreshing lineage ..."
+
+	pushd $ERRATA_WS_HOME
+	pipenv run python $ERRATA_WS_HOME/sh/pid_refresh_lineage.py
+
+	log "PID : lineage refresh complete ..."
+}
+
+# Invoke entry point.
+main
\ No newline at end of file
@@ -1,17 +1,21 @@
+import datetime as dt
 import logging
-import random
+import os
+import socket
 import time
 
-import schedule
-
-from b2handle.handleclient import EUDATHandleClient
 from errata_ws import db
 from errata_ws.handle_service import exceptions
+from errata_ws.handle_service.client import get_client
+from errata_ws.handle_service.utils import parse_dataset_identifier
 from errata_ws.handle_service.utils import resolve_input
 from errata_ws.utils import config
+from errata_ws.utils import config_loader
 from errata_ws.utils import constants
+from errata_ws.utils import executors
 from errata_ws.utils import logger
 from errata_ws.utils import pid_connector as pid
+from errata_ws.utils import pid_tasks
 
 
 
@@ -25,9 +29,61 @@ _TASK_HANDLERS = {
     constants.PID_ACTION_DELETE: pid.remove_errata_from_handle
 }
 
-# Interval in seconds between executions.
+# Interval in seconds between executions when task notifications are unavailable or a run fails.
 _RETRY_INTERVAL = config.pid.sync_retry_interval_in_seconds
 
+# Interval in seconds between executions whilst listening for task notifications - a safety net for missed notifications.
+_POLL_INTERVAL = config_loader.get_value('pid.sync_poll_interval_in_seconds', 3600)
+
+# Number of tasks processed (and committed) per batch.
+_BATCH_SIZE = config_loader.get_value('pid.sync_batch_size', 100)
+
+# Duration in seconds of a lease upon a batch of tasks - must exceed batch processing time.
+_LEASE_TIMEOUT = config_loader.get_value('pid.sync_lease_timeout_in_seconds', 600)
+
+# Lease owner identifying this worker amongst those syncing concurrently.
+_LEASE_OWNER = '{}:{}'.format(socket.gethostname(), os.getpid())
+
+
+
+def _run():
+    """Runs worker: tasks are synced when their insertion is notified, polling is a safety net.
+
+    """
+    listener = None
+    while True:
+        try:
+            _main()
+        except Exception as err:
+            logger.log_pid_error('PID syncing failed, retrying later: {}'.format(err))
+            time.sleep(_RETRY_INTERVAL)
+            continue
+
+        try:
+            if listener is None:
+                listener = db.notifications.listen()
+            db.notifications.wait(listener, _get_wait_timeout())
+        except Exception as err:
+            logger.log_pid_error('PID task notifications unavailable, polling instead: {}'.format(err))
+            if listener is not None:
+                try:
+                    listener.close()
+                except Exception:
+                    pass
+                listener = None
+            time.sleep(_RETRY_INTERVAL)
+
+
+def _get_wait_timeout():
+    """Returns time in seconds to wait for task notifications, i.e. until the earliest scheduled retry at most.
+
+    """
+    with db.session.create():
+        next_attempt = db.dao.get_next_pid_task_attempt()
+    if next_attempt is None:
+        return _POLL_INTERVAL
+
+    return max(0, min(_POLL_INTERVAL, (next_attempt - dt.datetime.utcnow()).total_seconds()))
 
 
 def _main():
@@ -35,40 +91,112 @@ def _main():
 
     """
     logger.log_pid("PID syncing: STARTS")
+    after_id = 0
     with pid.get_session() as pid_connection:
-        with db.session.create(commitable=True):
-            for task in db.dao.get_pid_tasks():
-                logger.log_pid('Syncing: {}'.format(task.dataset_id))
-                task.status, task.error = _sync(pid_connection, task)
-                task.try_count += 1
+        while True:
+            # Claim batch - leases are committed so that concurrent workers skip claimed tasks.
+            with db.session.create(commitable=True):
+                tasks, after_id = db.dao.claim_pid_tasks(_LEASE_OWNER, _LEASE_TIMEOUT, after_id, _BATCH_SIZE)
+                if after_id is None:
+                    break
+                if not tasks:
+                    continue
+
+            # Process batch - tasks whose lease has expired in the meantime are left to other workers.
+            with db.session.create(commitable=True):
+                tasks = db.dao.get_leased_pid_tasks(_LEASE_OWNER)
+                _sync_batch(pid_connection, tasks)
+            logger.log_pid('Batch of {} tasks committed'.format(len(tasks)))
     logger.log_pid("PID syncing: COMPLETE")
 
 
-def _sync(pid_connection, task):
-    """Synchronizes a task with remote PID handle service.
+def _sync_batch(pid_connection, tasks):
+    """Synchronizes a batch of tasks with remote PID handle service.
+
+    Tasks are coalesced into one update per dataset & action. Handles are checked concurrently,
+    updates are then dispatched serially over the shared connection.
+
+    """
+    # Coalesce tasks.
+    dead_pairs = db.dao.get_dead_pid_task_pairs([(i.dataset_id, i.issue_uid) for i in tasks])
+    outcomes, updates = pid_tasks.coalesce(tasks, dead_pairs)
+    logger.log_pid('... coalesced {} tasks into {} updates'.format(len(tasks), len(updates)))
+
+    # Check handles.
+    logger.log_pid('... checking {} handles'.format(len(updates)))
+    dataset_ids = sorted(set([i[0] for i in updates]))
+    checks = dict(zip(dataset_ids, executors.map_bounded(_check, dataset_ids, executors.POOL_HANDLE)))
+
+    # Update handles.
+    for (dataset_id, action), chains in updates.items():
+        logger.log_pid('Syncing: {}'.format(dataset_id))
+        issue_uids = sorted(set([i[-1].issue_uid for i in chains]))
+        outcome = checks[dataset_id] or _dispatch(pid_connection, dataset_id, action, issue_uids)
+        for task in [i for chain in chains for i in chain]:
+            outcomes[task.id] = outcome
+
+    # Record outcomes.
+    for task in tasks:
+        task.status, task.error = outcomes[task.id]
+        task.try_count = (task.try_count or 0) + 1
+        task.lease_owner, task.lease_expires = None, None
+        task.next_attempt = None
+        if task.status == constants.PID_TASK_STATE_ERROR:
+            pid_tasks.schedule_retry(task)
+        if task.status == constants.PID_TASK_STATE_COMPLETE:
+            task.synced = dt.datetime.utcnow()
+            _invalidate_lineage(task.dataset_id)
+
+
+def _check(dataset_id):
+    """Checks a dataset's handle prior to synchronization.
+
+    :returns: Task status & error if handle cannot be updated, otherwise None.
+    :rtype: tuple
 
     """
     try:
-        # Check handle.
-        logger.log_pid('... checking handle')
-        _check_handle_status(task.dataset_id)
+        _check_handle_status(dataset_id)
+    except Exception as err:
+        return _on_error(err)
+
 
-        # Update handle.
-        logger.log_pid('... calling update task')
-        task_handler = _TASK_HANDLERS[task.action]
-        task_handler(str(task.dataset_id), [str(task.issue_uid)], pid_connection)
+def _dispatch(pid_connection, dataset_id, action, issue_uids):
+    """Dispatches an update of a dataset's errata to remote PID handle service.
 
+    """
+    try:
+        logger.log_pid('... calling update task ({} errata)'.format(len(issue_uids)))
+        task_handler = _TASK_HANDLERS[action]
+        task_handler(str(dataset_id), [str(i) for i in issue_uids], pid_connection)
+    except Exception as err:
+        return _on_error(err)
+
+    return constants.PID_TASK_STATE_COMPLETE, None
+
+
+def _on_error(err):
+    """Logs a synchronization error & returns task status & error.
+
+    """
     # ... managed exceptions
-    except exceptions.HandleMismatch as err:
+    if isinstance(err, exceptions.HandleMismatch):
         logger.log_pid_warning(err)
-        return constants.PID_TASK_STATE_ERROR, unicode(err)[:1023]
 
     # ... unmanaged exceptions
-    except Exception as err:
+    else:
         logger.log_pid_error(err)
-        return constants.PID_TASK_STATE_ERROR, unicode(err)[:1023]
 
-    return constants.PID_TASK_STATE_COMPLETE, None
+    return constants.PID_TASK_STATE_ERROR, unicode(err)[:1023]
+
+
+def _invalidate_lineage(dataset_id):
+    """Discards recorded version lineage of a dataset whose errata have changed.
+
+    """
+    identifier = parse_dataset_identifier(dataset_id)
+    if identifier is not None:
+        db.dao.delete_lineage(identifier[0])
 
 
 def _check_handle_status(dataset_id):
@@ -80,8 +208,7 @@ def _check_handle_status(dataset_id):
     """
     # Get handle information.
     handle_string = resolve_input(dataset_id)
-    handle_client = EUDATHandleClient.instantiate_for_read_access()
-    encoded_dict = handle_client.retrieve_handle_record(handle_string)
+    encoded_dict = get_client().retrieve_handle_record(handle_string)
 
     # Error if not found.
     if encoded_dict is None:
@@ -104,7 +231,4 @@ def _check_handle_status(dataset_id):
 
 # Main entry point.
 if __name__ == '__main__':
-    schedule.every(_RETRY_INTERVAL).seconds.do(_main)
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
+    _run()
@@ -0,0 +1,238 @@
+import BaseHTTPServer
+import SocketServer
+import hashlib
+import json
+import threading
+import time
+import uuid
+
+from errata_ws.handle_service import cache
+from errata_ws.handle_service import client
+from errata_ws.handle_service.constants import *
+from errata_ws.handle_service.utils import make_handle_from_drsid_and_versionnumber
+
+
+
+# Handle server response code: success.
+_RESPONSE_CODE_SUCCESS = 1
+
+# Handle server response code: handle not found.
+_RESPONSE_CODE_NOT_FOUND = 100
+
+
+class FakeHandleService(object):
+    """An in-process stand-in for the handle server REST API serving a fixture of dataset version lineages.
+
+    Each lineage is a chain of dataset versions (REPLACES / REPLACED_BY) whose files keep
+    their file names across versions, so that both dataset and file level resolutions can be crawled.
+
+    """
+    def __init__(self, lineages=1, depth=3, files=10, latency=0.0, errata_every=2):
+        """Instance constructor.
+
+        :param int lineages: Number of dataset version lineages.
+        :param int depth: Number of dataset versions per lineage.
+        :param int files: Number of files per dataset version.
+        :param float latency: Delay in seconds applied to each request.
+        :param int errata_every: Interval between dataset versions bearing errata (0 = none).
+
+        """
+        self.latency = latency
+        self.lineages = []
+        self.records = {}
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._previous_client = None
+        self._server = None
+        for i in range(lineages):
+            self.lineages.append(self._add_lineage(u'cmip6.CMIP.IPSL.fake-{}'.format(i), depth, files, errata_every))
+
+
+    def __enter__(self):
+        """Starts service & points shared handle client at it.
+
+        """
+        self.start()
+        self.install()
+
+        return self
+
+
+    def __exit__(self, *args):
+        """Restores shared handle client & stops service.
+
+        """
+        self.uninstall()
+        self.stop()
+
+
+    @property
+    def url(self):
+        """Gets service base url.
+
+        """
+        return 'http://{}:{}'.format(*self._server.server_address)
+
+
+    def get_dataset_handles(self, lineage=0):
+        """Returns dataset handles of a lineage ordered from first to latest version.
+
+        :param int lineage: Lineage index.
+
+        """
+        return [i['handle'] for i in self.lineages[lineage]]
+
+
+    def get_file_handles(self, lineage=0, version=0):
+        """Returns file handles of a dataset version.
+
+        :param int lineage: Lineage index.
+        :param int version: Version index (0 = first).
+
+        """
+        return self.lineages[lineage][version]['files']
+
+
+    def get_record(self, handle):
+        """Returns handle record as served by REST API.
+
+        :param str handle: Handle string.
+
+        :returns: Handle record or None if handle does not exist.
+        :rtype: dict
+
+        """
+        with self._lock:
+            self.request_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        try:
+            values = self.records[handle]
+        except KeyError:
+            return None
+
+        return {
+            'responseCode': _RESPONSE_CODE_SUCCESS,
+            'handle': handle,
+            'values': [{'index': i + 1, 'type': k, 'data': {'format': 'string', 'value': v}}
+                       for i, (k, v) in enumerate(sorted(values.items()))]
+        }
+
+
+    def reset_request_count(self):
+        """Resets request counter.
+
+        """
+        with self._lock:
+            self.request_count = 0
+
+
+    def start(self):
+        """Starts serving requests upon a free local port.
+
+        """
+        service = self
+
+        class _RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+            def do_GET(self):
+                record = service.get_record(self.path.split('/api/handles/', 1)[-1])
+                if record is None:
+                    self.send_response(404)
+                    record = {'responseCode': _RESPONSE_CODE_NOT_FOUND}
+                else:
+                    self.send_response(200)
+                content = json.dumps(record)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = _HTTPServer(('127.0.0.1', 0), _RequestHandler)
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+
+    def stop(self):
+        """Stops serving requests.
+
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+    def install(self):
+        """Points shared handle client at service & empties handle record cache.
+
+        """
+        self._previous_client = client._client
+        client._client = client.HandleClient(server_url=self.url)
+        cache.invalidate()
+
+
+    def uninstall(self):
+        """Restores shared handle client & empties handle record cache.
+
+        """
+        client._client = self._previous_client
+        cache.invalidate()
+
+
+    def _add_lineage(self, drs_id, depth, files, errata_every):
+        """Adds a chain of dataset versions to the fixture.
+
+        """
+        versions = []
+        for i in range(depth):
+            version = unicode(20180101 + i)
+            handle = make_handle_from_drsid_and_versionnumber(prefix=PORT, drs_id=drs_id, version_number=version)
+            versions.append({
+                'handle': handle,
+                'files': [_get_handle(u'{}.v{}/file-{}'.format(drs_id, version, j)) for j in range(files)]
+            })
+            self.records[handle] = {
+                AGGREGATION_LEVEL: DATASET,
+                DRS: drs_id,
+                VERSION: version,
+                URL: u'http://fake-data-node/{}.v{}'.format(drs_id, version)
+            }
+            if errata_every and (i + 1) % errata_every == 0:
+                self.records[handle][ERRATA_IDS] = unicode(uuid.uuid3(uuid.NAMESPACE_URL, handle.encode('utf8')))
+            if files:
+                self.records[handle][CHILDREN] = u';'.join([HDL_PREFIX + j for j in versions[-1]['files']])
+
+            for j, file_handle in enumerate(versions[-1]['files']):
+                self.records[file_handle] = {
+                    AGGREGATION_LEVEL: FILE,
+                    FILE_NAME: u'var-{}_{}.nc'.format(j, drs_id.split('.')[-1]),
+                    FILE_VERSION: version,
+                    CHECKSUM: unicode(hashlib.md5(file_handle).hexdigest()),
+                    PARENTS: HDL_PREFIX + handle,
+                    URL: u'http://fake-data-node/{}'.format(file_handle)
+                }
+
+        for previous, current in zip(versions[:-1], versions[1:]):
+            self.records[previous['handle']][SUCCESSOR] = HDL_PREFIX + current['handle']
+            self.records[current['handle']][PREDECESSOR] = HDL_PREFIX + previous['handle']
+
+        return versions
+
+
+class _HTTPServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """Multi-threaded HTTP server so that concurrent handle fetches overlap.
+
+    """
+    daemon_threads = True
+
+
+def _get_handle(basis):
+    """Returns a deterministic handle string.
+
+    """
+    return u'{}/{}'.format(PORT, uuid.uuid3(uuid.NAMESPACE_URL, basis.encode('utf8')))
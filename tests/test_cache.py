@@ -0,0 +1,57 @@
+import time
+
+from errata_ws.utils.cache import Cache
+
+
+
+def test_expiry():
+    """ERRATA :: WS :: CACHE :: entries expire after time to live.
+
+    """
+    cache = Cache(0.05)
+    cache.set('key', 'value')
+    assert cache.get('key') == 'value'
+    time.sleep(0.1)
+    assert cache.get('key') is None
+
+
+def test_eviction():
+    """ERRATA :: WS :: CACHE :: least recently used entries are evicted.
+
+    """
+    cache = Cache(60, max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_invalidation():
+    """ERRATA :: WS :: CACHE :: values computed before invalidation are discarded.
+
+    """
+    cache = Cache(60)
+
+    def _factory():
+        cache.invalidate()
+        return 'stale'
+
+    assert cache.get_or_set('key', _factory) == 'stale'
+    assert cache.get('key') is None
+    assert cache.get_or_set('key', lambda: 'fresh') == 'fresh'
+    assert cache.get('key') == 'fresh'
+
+
+def test_entry_ttl():
+    """ERRATA :: WS :: CACHE :: entry time to live overrides cache time to live.
+
+    """
+    cache = Cache(60)
+    cache.set('short', 1, ttl=0.05)
+    cache.set('long', 2)
+    time.sleep(0.1)
+    assert cache.get('short') is None
+    assert cache.get('long') == 2
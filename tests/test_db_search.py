@@ -0,0 +1,59 @@
+from sqlalchemy import event
+
+from errata_ws import db
+
+
+
+# Set of search criteria.
+_CRITERIA = [
+    'esdoc:errata:severity:low',
+    'esdoc:errata:status:new'
+    ]
+
+
+def test_get_issues_single_query():
+    """ERRATA :: WS :: DB :: search compiles to a single query.
+
+    """
+    statements = _get_statements()
+
+    assert len(statements) == 1
+    assert statements[0][0].upper().count('SELECT') == 2
+    assert 'HAVING' in statements[0][0].upper()
+
+
+def test_get_issues_plan():
+    """ERRATA :: WS :: DB :: search uses facet index.
+
+    """
+    statement, parameters = _get_statements()[0]
+    connection = db.session.sa_engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute('SET enable_seqscan = off')
+        cursor.execute('EXPLAIN {}'.format(statement), parameters)
+        plan = '\n'.join([i[0] for i in cursor.fetchall()])
+    finally:
+        connection.rollback()
+        connection.close()
+
+    assert 'idx_issue_facet_type_value' in plan, plan
+
+
+def _get_statements():
+    """Returns set of statements executed whilst searching.
+
+    """
+    statements = []
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    with db.session.create():
+        event.listen(db.session.sa_engine, 'before_cursor_execute', _on_execute)
+        try:
+            db.dao.get_issues(_CRITERIA, True)
+        finally:
+            event.remove(db.session.sa_engine, 'before_cursor_execute', _on_execute)
+
+    return statements
@@ -0,0 +1,54 @@
+from errata_ws.handle_service.client import get_client
+from errata_ws.handle_service.crawler import crawler
+from errata_ws.handle_service.harvest import harvest_simple_errata
+from errata_ws.handle_service.utils import get_handle_by_handle_string
+from tests.fake_handle_service import FakeHandleService
+
+
+
+def test_crawl_dataset():
+    """ERRATA :: WS :: HANDLE SERVICE :: dataset lineage is crawled from any of its versions.
+
+    """
+    with FakeHandleService(depth=4, files=2) as service:
+        handles = service.get_dataset_handles()
+        for i, handle_string in enumerate(handles):
+            output, incomplete = crawler(get_handle_by_handle_string(handle_string, get_client()), get_client())
+            assert not incomplete
+            assert sorted(output) == sorted(handles)
+            assert [output[j][3] for j in handles] == range(-i, len(handles) - i)
+            assert [bool(output[j][0]) for j in handles] == [False, True, False, True]
+
+
+def test_crawl_dataset_requests():
+    """ERRATA :: WS :: HANDLE SERVICE :: each handle of a dataset lineage is fetched once.
+
+    """
+    with FakeHandleService(depth=8, files=2) as service:
+        handles = service.get_dataset_handles()
+        crawler(get_handle_by_handle_string(handles[-1], get_client()), get_client())
+        assert service.request_count == len(handles)
+
+
+def test_crawl_file():
+    """ERRATA :: WS :: HANDLE SERVICE :: file is traced across all versions of its dataset.
+
+    """
+    with FakeHandleService(depth=3, files=4) as service:
+        handles = service.get_dataset_handles()
+        file_handle = service.get_file_handles(version=0)[2]
+        output, incomplete = crawler(get_handle_by_handle_string(file_handle, get_client()), get_client())
+        assert not incomplete
+        assert sorted(output) == sorted(handles)
+        assert [output[i][3] for i in handles] == [0, 1, 2]
+        assert len(set([output[i][1] for i in handles])) == 1
+
+
+def test_harvest_simple_errata():
+    """ERRATA :: WS :: HANDLE SERVICE :: errata of a single dataset version are harvested.
+
+    """
+    with FakeHandleService(depth=2, files=1) as service:
+        first, latest = service.get_dataset_handles()
+        assert harvest_simple_errata(first)[4] is False
+        assert harvest_simple_errata(latest)[4] is True
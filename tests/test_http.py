@@ -0,0 +1,59 @@
+import threading
+
+import tornado.ioloop
+
+from errata_ws import schemas
+from errata_ws.utils import executors
+from errata_ws.utils import http
+
+
+
+class _Request(object):
+    """Minimal stand-in for a tornado request upon a whitelisted endpoint.
+
+    """
+    path = '/status'
+    body = ''
+    headers = {}
+    query_arguments = {}
+
+
+class _Handler(object):
+    """Minimal stand-in for a tornado request handler recording its response.
+
+    """
+    def __init__(self):
+        self.request = _Request()
+        self.output_written = []
+        self.status = None
+
+    def clear(self):
+        self.output_written = []
+
+    def set_header(self, name, value):
+        pass
+
+    def set_status(self, status):
+        self.status = status
+
+    def write(self, chunk):
+        self.output_written.append(chunk)
+
+
+def test_process_request_async():
+    """ERRATA :: WS :: HTTP :: request tasks execute upon endpoint class thread pool.
+
+    """
+    schemas.init([_Request.path])
+    handler = _Handler()
+
+    def _set_output():
+        handler.thread = threading.current_thread()
+        handler.output = {'value': 1}
+
+    tornado.ioloop.IOLoop.current().run_sync(
+        lambda: http.process_request_async(handler, [_set_output], pool_id=executors.POOL_SEARCH))
+
+    assert handler.status is None
+    assert handler.output_written == [{'value': 1}]
+    assert handler.thread in executors.get_executor(executors.POOL_SEARCH)._threads
@@ -0,0 +1,119 @@
+import functools
+import itertools
+
+from errata_ws.utils import http_security
+from errata_ws.utils import security
+from errata_ws.utils.constants import *
+
+
+
+# GitHub {project}-{institute} team.
+_TEAM_INSTITUTE = 'cmip6-ipsl'
+
+# GitHub teams probed when authorizing.
+_TEAMS_AUTHORIZATION = [http_security._GH_TEAM_MODERATION, http_security._GH_TEAM_PUBLICATION, _TEAM_INSTITUTE]
+
+# GitHub teams probed when determining a user's role.
+_TEAMS_ROLE = [http_security._GH_TEAM_MODERATION, http_security._GH_TEAM_PUBLICATION]
+
+
+
+class _Probe(object):
+    """Stand-in for a completed membership probe.
+
+    """
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    def result(self):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+def test_authorization_moderator():
+    """ERRATA :: WS :: HTTP SECURITY :: moderators are authorized whatever the probe completion order.
+
+    """
+    decide = functools.partial(http_security._decide_authorization, _TEAM_INSTITUTE)
+    for outcomes in (
+        {http_security._GH_TEAM_MODERATION: True, http_security._GH_TEAM_PUBLICATION: False, _TEAM_INSTITUTE: False},
+        {http_security._GH_TEAM_MODERATION: True, http_security._GH_TEAM_PUBLICATION: True, _TEAM_INSTITUTE: True},
+        {http_security._GH_TEAM_MODERATION: True, http_security._GH_TEAM_PUBLICATION: False, _TEAM_INSTITUTE: IOError()}
+    ):
+        for order in itertools.permutations(_TEAMS_AUTHORIZATION):
+            assert _decide(decide, outcomes, order) == USER_ROLE_MODERATOR
+
+
+def test_authorization_author():
+    """ERRATA :: WS :: HTTP SECURITY :: publishers are authorized whatever the probe completion order.
+
+    """
+    decide = functools.partial(http_security._decide_authorization, _TEAM_INSTITUTE)
+    outcomes = {http_security._GH_TEAM_MODERATION: False, http_security._GH_TEAM_PUBLICATION: True, _TEAM_INSTITUTE: True}
+    for order in itertools.permutations(_TEAMS_AUTHORIZATION):
+        assert _decide(decide, outcomes, order) == USER_ROLE_AUTHOR
+
+
+def test_authorization_denied():
+    """ERRATA :: WS :: HTTP SECURITY :: non members are denied whatever the probe completion order.
+
+    """
+    decide = functools.partial(http_security._decide_authorization, _TEAM_INSTITUTE)
+    for outcomes in (
+        {http_security._GH_TEAM_MODERATION: False, http_security._GH_TEAM_PUBLICATION: False, _TEAM_INSTITUTE: True},
+        {http_security._GH_TEAM_MODERATION: False, http_security._GH_TEAM_PUBLICATION: True, _TEAM_INSTITUTE: False},
+        {http_security._GH_TEAM_MODERATION: False, http_security._GH_TEAM_PUBLICATION: False, _TEAM_INSTITUTE: False}
+    ):
+        for order in itertools.permutations(_TEAMS_AUTHORIZATION):
+            try:
+                _decide(decide, outcomes, order)
+            except security.AuthorizationError:
+                pass
+            else:
+                assert False, 'Authorization granted to non member: {}'.format(order)
+
+
+def test_authorization_probe_failure():
+    """ERRATA :: WS :: HTTP SECURITY :: failed probes of non moderators propagate.
+
+    """
+    decide = functools.partial(http_security._decide_authorization, _TEAM_INSTITUTE)
+    outcomes = {http_security._GH_TEAM_MODERATION: False, http_security._GH_TEAM_PUBLICATION: True, _TEAM_INSTITUTE: IOError()}
+    for order in itertools.permutations(_TEAMS_AUTHORIZATION):
+        try:
+            _decide(decide, outcomes, order)
+        except IOError:
+            pass
+        else:
+            assert False, 'Authorization decided despite failed probe: {}'.format(order)
+
+
+def test_role():
+    """ERRATA :: WS :: HTTP SECURITY :: user role is decided whatever the probe completion order.
+
+    """
+    for moderator, author, role in (
+        (True, False, USER_ROLE_MODERATOR),
+        (True, True, USER_ROLE_MODERATOR),
+        (True, IOError(), USER_ROLE_MODERATOR),
+        (False, True, USER_ROLE_AUTHOR),
+        (False, False, USER_ROLE_ANONYMOUS)
+    ):
+        outcomes = {http_security._GH_TEAM_MODERATION: moderator, http_security._GH_TEAM_PUBLICATION: author}
+        for order in itertools.permutations(_TEAMS_ROLE):
+            assert _decide(http_security._decide_role, outcomes, order) == role
+
+
+def _decide(decide, outcomes, order):
+    """Returns outcome decided as probes complete in a given order, as per http_security._probe_memberships.
+
+    """
+    memberships = {}
+    for team_id in order:
+        memberships[team_id] = _Probe(outcomes[team_id])
+        outcome = decide(memberships)
+        if outcome is not None:
+            return outcome
+
+    return decide(memberships)
@@ -0,0 +1,162 @@
+import collections
+import datetime as dt
+
+from errata_ws.utils import pid_tasks
+from errata_ws.utils.constants import *
+
+
+
+# Stand-in for a PID service task.
+_Task = collections.namedtuple('_Task', ['id', 'dataset_id', 'issue_uid', 'action'])
+
+
+class _FailedTask(object):
+    """Stand-in for a failed PID service task.
+
+    """
+    def __init__(self, try_count):
+        self.dataset_id = _DATASET_A
+        self.next_attempt = None
+        self.status = PID_TASK_STATE_ERROR
+        self.try_count = try_count
+
+# Dataset identifiers.
+_DATASET_A = 'cmip6.CMIP.IPSL.a#20180101'
+_DATASET_B = 'cmip6.CMIP.IPSL.b#20180101'
+
+
+
+def test_coalesce_cancel():
+    """ERRATA :: WS :: PID TASKS :: an insert then delete chain cancels out.
+
+    """
+    tasks = [
+        _Task(1, _DATASET_A, 'i1', PID_ACTION_INSERT),
+        _Task(2, _DATASET_A, 'i1', PID_ACTION_DELETE)
+    ]
+    outcomes, updates = pid_tasks.coalesce(tasks, set())
+    assert outcomes == {1: (PID_TASK_STATE_COMPLETE, None), 2: (PID_TASK_STATE_COMPLETE, None)}
+    assert not updates
+
+
+def test_coalesce_net_action():
+    """ERRATA :: WS :: PID TASKS :: an insert, delete then insert chain nets to an insert.
+
+    """
+    tasks = [
+        _Task(3, _DATASET_A, 'i1', PID_ACTION_INSERT),
+        _Task(1, _DATASET_A, 'i1', PID_ACTION_INSERT),
+        _Task(2, _DATASET_A, 'i1', PID_ACTION_DELETE)
+    ]
+    outcomes, updates = pid_tasks.coalesce(tasks, set())
+    assert not outcomes
+    assert updates.keys() == [(_DATASET_A, PID_ACTION_INSERT)]
+    assert [[i.id for i in j] for j in updates[(_DATASET_A, PID_ACTION_INSERT)]] == [[1, 2, 3]]
+
+
+def test_coalesce_non_alternating():
+    """ERRATA :: WS :: PID TASKS :: a non alternating chain is dispatched with its last action.
+
+    """
+    tasks = [
+        _Task(1, _DATASET_A, 'i1', PID_ACTION_INSERT),
+        _Task(2, _DATASET_A, 'i1', PID_ACTION_INSERT),
+        _Task(3, _DATASET_A, 'i1', PID_ACTION_DELETE)
+    ]
+    outcomes, updates = pid_tasks.coalesce(tasks, set())
+    assert not outcomes
+    assert updates.keys() == [(_DATASET_A, PID_ACTION_DELETE)]
+
+
+def test_coalesce_dead_pair():
+    """ERRATA :: WS :: PID TASKS :: a chain whose pair has a dead-lettered task is dispatched.
+
+    """
+    tasks = [
+        _Task(1, _DATASET_A, 'i1', PID_ACTION_INSERT),
+        _Task(2, _DATASET_A, 'i1', PID_ACTION_DELETE)
+    ]
+    outcomes, updates = pid_tasks.coalesce(tasks, set([(_DATASET_A, 'i1')]))
+    assert not outcomes
+    assert updates.keys() == [(_DATASET_A, PID_ACTION_DELETE)]
+
+
+def test_coalesce_grouping():
+    """ERRATA :: WS :: PID TASKS :: issues of a dataset are grouped into one update per action.
+
+    """
+    tasks = [
+        _Task(1, _DATASET_A, 'i1', PID_ACTION_INSERT),
+        _Task(2, _DATASET_A, 'i2', PID_ACTION_INSERT),
+        _Task(3, _DATASET_B, 'i1', PID_ACTION_INSERT),
+        _Task(4, _DATASET_A, 'i3', PID_ACTION_DELETE),
+        _Task(5, _DATASET_A, 'i4', PID_ACTION_INSERT)
+    ]
+    outcomes, updates = pid_tasks.coalesce(tasks, set())
+    assert not outcomes
+    assert updates.keys() == [
+        (_DATASET_A, PID_ACTION_INSERT),
+        (_DATASET_B, PID_ACTION_INSERT),
+        (_DATASET_A, PID_ACTION_DELETE)
+    ]
+    assert [j.issue_uid for i in updates[(_DATASET_A, PID_ACTION_INSERT)] for j in i] == ['i1', 'i2', 'i4']
+
+
+def test_retry_backoff():
+    """ERRATA :: WS :: PID TASKS :: retry delay doubles from backoff base & is capped at backoff max.
+
+    """
+    uniform = pid_tasks.random.uniform
+    pid_tasks.random.uniform = lambda low, high: high
+    try:
+        for try_count in range(1, pid_tasks._MAX_TRIES):
+            expected = min(pid_tasks._BACKOFF_MAX, pid_tasks._BACKOFF_BASE * 2 ** (try_count - 1))
+            assert abs(_get_retry_delay(try_count) - expected) < 1
+        assert abs(_get_retry_delay(1) - pid_tasks._BACKOFF_BASE) < 1
+        assert abs(_get_retry_delay(2) - pid_tasks._BACKOFF_BASE * 2) < 1
+    finally:
+        pid_tasks.random.uniform = uniform
+
+    max_tries = pid_tasks._MAX_TRIES
+    pid_tasks._MAX_TRIES = 64
+    try:
+        assert _get_retry_delay(63) <= pid_tasks._BACKOFF_MAX + 1
+    finally:
+        pid_tasks._MAX_TRIES = max_tries
+
+
+def test_retry_jitter():
+    """ERRATA :: WS :: PID TASKS :: retry delay is jittered within half & full backoff delay.
+
+    """
+    for try_count in range(1, pid_tasks._MAX_TRIES):
+        delay = min(pid_tasks._BACKOFF_MAX, pid_tasks._BACKOFF_BASE * 2 ** (try_count - 1))
+        for _ in range(20):
+            assert delay / 2.0 - 1 <= _get_retry_delay(try_count) <= delay + 1
+
+
+def test_retry_dead_letter():
+    """ERRATA :: WS :: PID TASKS :: task is dead-lettered once max tries are reached.
+
+    """
+    for try_count in (pid_tasks._MAX_TRIES, pid_tasks._MAX_TRIES + 1):
+        task = _FailedTask(try_count)
+        pid_tasks.schedule_retry(task)
+        assert task.status == PID_TASK_STATE_DEAD
+        assert task.next_attempt is None
+
+    task = _FailedTask(pid_tasks._MAX_TRIES - 1)
+    pid_tasks.schedule_retry(task)
+    assert task.status == PID_TASK_STATE_ERROR
+    assert task.next_attempt is not None
+
+
+def _get_retry_delay(try_count):
+    """Returns delay in seconds until retry of a task failed after a number of attempts.
+
+    """
+    task = _FailedTask(try_count)
+    now = dt.datetime.utcnow()
+    pid_tasks.schedule_retry(task)
+
+    return (task.next_attempt - now).total_seconds()
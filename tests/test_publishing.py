@@ -31,6 +31,9 @@ _URL_RETRIEVE += urllib.urlencode({
     'uid': _ISSUE['uid']
     })
 
+# Test endpoint: retrieve all issues.
+_URL_RETRIEVE_ALL = '{}/2/publication/retrieve-all'.format(tu.BASE_URL)
+
 # Test endpoint: update issue.
 _URL_UPDATE = "{}/1/issue/update".format(tu.BASE_URL)
 
@@ -51,6 +54,30 @@ def test_create():
     tu.assert_ws_response(_URL_CREATE, response)
 
 
+def test_create_duplicate_title():
+    """ERRATA :: WS :: PUBLISHING :: create issue with an existing title.
+
+    """
+    # Set issue with same title as test issue.
+    issue = factory.create_issue_dict()
+    issue['title'] = _ISSUE['title']
+
+    # Invoke WS endpoint.
+    response = requests.post(
+        _URL_CREATE,
+        data=json.dumps(issue),
+        headers={'Content-Type': 'application/json'},
+        auth=tu.get_credentials()
+        )
+
+    # Assert WS response.
+    content = tu.assert_ws_response(_URL_CREATE, response, status_code=constants.HTTP_RESPONSE_BAD_REQUEST_ERROR)
+
+    # Assert error.
+    assert content['error_type'] == 'TitleExistsError'
+    assert content['error_field'] == constants.JF_TITLE
+
+
 def test_create_retrieve():
     """ERRATA :: WS :: PUBLISHING :: retrieve created issue.
 
@@ -151,6 +178,46 @@ def test_close_retrieve():
     _assert_tracking_info(issue)
 
 
+def test_retrieve_all_paged():
+    """ERRATA :: WS :: PUBLISHING :: retrieve all issues page by page.
+
+    """
+    # Invoke WS endpoint page by page.
+    uids, cursor = [], None
+    while True:
+        params = {'limit': 2}
+        if cursor is not None:
+            params['cursor'] = cursor
+        response = requests.get(_URL_RETRIEVE_ALL, params=params)
+        content = tu.assert_ws_response(_URL_RETRIEVE_ALL, response, fields={'count', 'issues', 'nextCursor'})
+        assert content['count'] <= 2
+        uids += [i['uid'] for i in content['issues']]
+        cursor = content['nextCursor']
+        if cursor is None:
+            break
+
+    # Assert pages are disjoint & complete.
+    response = requests.get(_URL_RETRIEVE_ALL)
+    content = tu.assert_ws_response(_URL_RETRIEVE_ALL, response)
+    assert len(uids) == len(set(uids))
+    assert set(uids) == set([i['uid'] for i in content['issues']])
+
+
+def test_retrieve_all_streamed():
+    """ERRATA :: WS :: PUBLISHING :: retrieve all issues as a stream.
+
+    """
+    # Invoke WS endpoint.
+    response = requests.get(_URL_RETRIEVE_ALL, params={'stream': 'true'})
+    content = tu.assert_ws_response(_URL_RETRIEVE_ALL, response, fields={'count', 'issues'})
+
+    # Assert streamed content.
+    assert content['count'] == len(content['issues'])
+    response = requests.get(_URL_RETRIEVE_ALL)
+    expected = tu.assert_ws_response(_URL_RETRIEVE_ALL, response)['issues']
+    assert sorted(content['issues'], key=lambda i: i['uid']) == sorted(expected, key=lambda i: i['uid'])
+
+
 def _assert_tracking_info(issue):
     """Performs assertions over issue tracking information.
 
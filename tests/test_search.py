@@ -16,6 +16,7 @@ from tests import utils as tu
 _URL_CREATE = "{}/1/issue/create".format(tu.BASE_URL)
 _URL_SEARCH_SETUP = "{}/1/issue/search-setup".format(tu.BASE_URL)
 _URL_SEARCH = "{}/1/issue/search".format(tu.BASE_URL)
+_URL_SEARCH_FACET_COUNTS = "{}/2/search/errata/facet-counts".format(tu.BASE_URL)
 
 
 def test_search_setup():
@@ -78,3 +79,24 @@ def test_search():
 
         # Assert search total.
         assert data['total'] >= criteria[project, severity, status]
+
+
+def test_search_facet_counts():
+    """ERRATA :: WS :: SEARCH :: facet counts.
+
+    """
+    # Invoke WS endpoint.
+    r = requests.get(_URL_SEARCH_FACET_COUNTS)
+
+    # Assert WS response.
+    obj = tu.assert_ws_response(_URL_SEARCH_FACET_COUNTS, r, fields={'count', 'results'})
+    assert obj['count'] == len(obj['results'])
+    for result in obj['results']:
+        assert result['count'] > 0
+
+    # Assert counts are restricted by criteria.
+    if obj['results']:
+        facet = obj['results'][0]
+        r = requests.get(_URL_SEARCH_FACET_COUNTS, params={'criteria': facet['facet']})
+        restricted = tu.assert_ws_response(_URL_SEARCH_FACET_COUNTS, r)
+        assert {'facet': facet['facet'], 'count': facet['count']} in restricted['results']
@@ -0,0 +1,176 @@
+import json
+import time
+
+from errata_ws.utils import security
+
+
+
+# GitHub user.
+_USER_ID = 'errata-user'
+
+# GitHub user credentials.
+_CREDENTIALS = (_USER_ID, 'access-token')
+
+# GitHub teams.
+_TEAM_ID = 'errata-publication'
+_TEAM_ID_OTHER = 'errata-moderation'
+
+# Time to live in seconds of negative outcomes whilst testing.
+_NEGATIVE_TTL = 0.05
+
+
+
+class _Response(object):
+    """Stand-in for a GitHub API response.
+
+    """
+    def __init__(self, status_code, login=_USER_ID):
+        self.headers = {'X-OAuth-Scopes': 'read:org'}
+        self.status_code = status_code
+        self.text = json.dumps({'login': login})
+
+
+class _GitHub(object):
+    """Stand-in for requests.get serving a fixed response code & counting calls.
+
+    """
+    def __init__(self, status_code):
+        self.calls = 0
+        self.status_code = status_code
+
+    def __enter__(self):
+        self._get, security.requests.get = security.requests.get, self.get
+        self._negative_ttl, security._NEGATIVE_TTL = security._NEGATIVE_TTL, _NEGATIVE_TTL
+        security.invalidate_authentication()
+        security.invalidate_membership()
+
+        return self
+
+    def __exit__(self, *args):
+        security.requests.get = self._get
+        security._NEGATIVE_TTL = self._negative_ttl
+        security.invalidate_authentication()
+        security.invalidate_membership()
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return _Response(self.status_code)
+
+
+def test_authentication_cached():
+    """ERRATA :: WS :: SECURITY :: successful authentications are cached.
+
+    """
+    with _GitHub(200) as github:
+        for _ in range(3):
+            assert security.authenticate_user(_CREDENTIALS) == _USER_ID
+        assert github.calls == 1
+
+
+def test_authentication_negative_cached():
+    """ERRATA :: WS :: SECURITY :: failed authentications are cached for negative time to live.
+
+    """
+    with _GitHub(401) as github:
+        for _ in range(3):
+            _assert_raises(security.AuthenticationError, security.authenticate_user, _CREDENTIALS)
+        assert github.calls == 1
+        time.sleep(_NEGATIVE_TTL * 2)
+        _assert_raises(security.AuthenticationError, security.authenticate_user, _CREDENTIALS)
+        assert github.calls == 2
+
+
+def test_authentication_transient_failure():
+    """ERRATA :: WS :: SECURITY :: transiently failed authentications are not cached.
+
+    """
+    with _GitHub(502) as github:
+        for _ in range(3):
+            _assert_raises(security.AuthenticationError, security.authenticate_user, _CREDENTIALS)
+        assert github.calls == 3
+        github.status_code = 200
+        assert security.authenticate_user(_CREDENTIALS) == _USER_ID
+
+
+def test_membership_cached():
+    """ERRATA :: WS :: SECURITY :: team memberships are cached.
+
+    """
+    with _GitHub(200) as github:
+        for _ in range(3):
+            security.authorize_user(_TEAM_ID, _USER_ID)
+        assert github.calls == 1
+
+
+def test_membership_negative_cached():
+    """ERRATA :: WS :: SECURITY :: team non memberships are cached for negative time to live.
+
+    """
+    with _GitHub(404) as github:
+        for _ in range(3):
+            _assert_raises(security.AuthorizationError, security.authorize_user, _TEAM_ID, _USER_ID)
+        assert github.calls == 1
+        time.sleep(_NEGATIVE_TTL * 2)
+        _assert_raises(security.AuthorizationError, security.authorize_user, _TEAM_ID, _USER_ID)
+        assert github.calls == 2
+
+
+def test_membership_transient_failure():
+    """ERRATA :: WS :: SECURITY :: transiently failed team membership checks are not cached.
+
+    """
+    with _GitHub(502) as github:
+        for _ in range(3):
+            _assert_raises(security.AuthorizationError, security.authorize_user, _TEAM_ID, _USER_ID)
+        assert github.calls == 3
+        github.status_code = 200
+        security.authorize_user(_TEAM_ID, _USER_ID)
+
+
+def test_invalidate_authentication():
+    """ERRATA :: WS :: SECURITY :: invalidating an authentication removes its credentials only.
+
+    """
+    credentials_other = (_USER_ID, 'other-access-token')
+    with _GitHub(200) as github:
+        security.authenticate_user(_CREDENTIALS)
+        security.authenticate_user(credentials_other)
+        security.invalidate_authentication(_CREDENTIALS)
+        security.authenticate_user(_CREDENTIALS)
+        security.authenticate_user(credentials_other)
+        assert github.calls == 3
+
+        security.invalidate_authentication()
+        security.authenticate_user(_CREDENTIALS)
+        security.authenticate_user(credentials_other)
+        assert github.calls == 5
+
+
+def test_invalidate_membership():
+    """ERRATA :: WS :: SECURITY :: invalidating a membership removes its (team, user) only.
+
+    """
+    with _GitHub(200) as github:
+        security.authorize_user(_TEAM_ID, _USER_ID)
+        security.authorize_user(_TEAM_ID_OTHER, _USER_ID)
+        security.invalidate_membership(_TEAM_ID, _USER_ID)
+        security.authorize_user(_TEAM_ID, _USER_ID)
+        security.authorize_user(_TEAM_ID_OTHER, _USER_ID)
+        assert github.calls == 3
+
+        security.invalidate_membership()
+        security.authorize_user(_TEAM_ID, _USER_ID)
+        security.authorize_user(_TEAM_ID_OTHER, _USER_ID)
+        assert github.calls == 5
+
+
+def _assert_raises(error_type, func, *args):
+    """Asserts a function call raises an error.
+
+    """
+    try:
+        func(*args)
+    except error_type:
+        pass
+    else:
+        assert False, '{} not raised'.format(error_type.__name__)